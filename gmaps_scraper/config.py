@@ -12,16 +12,180 @@ Version: 18.0.0
 """
 
 import os
-from typing import Dict, List, Tuple, Final
+import copy
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Final
 from pathlib import Path
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from lxml import etree
+from cssselect import HTMLTranslator
 
-# Import constants
+# Import constants (direct names: satu LOAD_NAME di class body, bukan + LOAD_ATTR)
 try:
-    from . import constants as const
+    from .constants import (
+        BACKOFF_FACTOR,
+        CHROMEDRIVER_PATH,
+        CSV_BUFFER_SIZE,
+        CSV_ENCODING,
+        BLOCKED_URLS_EMAIL,
+        BLOCKED_URLS_MAPS,
+        CSV_HEADERS,
+        CSV_HEADER_ALAMAT,
+        CSV_HEADER_DESKRIPSI,
+        CSV_HEADER_EMAIL,
+        CSV_HEADER_KOTA,
+        CSV_HEADER_LOGO,
+        CSV_HEADER_MAP_URL,
+        CSV_HEADER_NAMA,
+        CSV_HEADER_TELEPON,
+        CSV_HEADER_WEBSITE,
+        DATE_FORMAT,
+        DEFAULT_MAX_SCROLLS,
+        DELAY_AFTER_SEARCH,
+        DELAY_DETAIL_PAGE,
+        DELAY_RETRY_BASE,
+        DELAY_SCROLL_PAUSE,
+        DETAIL_CONCURRENCY,
+        EMAIL_BLACKLIST_SET,
+        EMAIL_CONCURRENCY,
+        EMAIL_HTTP_POOL_SIZE,
+        EMAIL_IMAGE_EXTENSIONS,
+        EMAIL_MAX_LENGTH,
+        EMAIL_MAX_PENDING,
+        EMAIL_MIN_HTML_LENGTH,
+        EMAIL_MIN_LENGTH,
+        EMAIL_SCAN_CHUNK_SIZE,
+        FLUSH_INTERVAL,
+        LOG_DATE_FORMAT,
+        LOG_FILE_NAME,
+        LOG_FORMAT,
+        LOG_LEVEL_DEFAULT,
+        MAX_LENGTH_ALAMAT,
+        MAX_LENGTH_DESKRIPSI,
+        MAX_LENGTH_EMAIL,
+        MAX_LENGTH_KOTA,
+        MAX_LENGTH_LOGO,
+        MAX_LENGTH_MAP_URL,
+        MAX_LENGTH_NAMA,
+        MAX_LENGTH_TELEPON,
+        MAX_LENGTH_WEBSITE,
+        MAX_RETRIES,
+        OUTPUT_DIR_NAME,
+        OUTPUT_FALLBACK_NAME,
+        PROGRESS_LOG_INTERVAL,
+        RESUME_FILE_SUFFIX,
+        RESUME_HASH_LENGTH,
+        RETRY_JITTER,
+        RETRY_MAX_DELAY,
+        SCROLL_PROGRESS_INTERVAL,
+        SELECTOR_ID_ADDRESS,
+        SELECTOR_ID_CATEGORY,
+        SELECTOR_ID_END_OF_LIST,
+        SELECTOR_ID_FEED,
+        SELECTOR_ID_LOGO,
+        SELECTOR_ID_MAILTO,
+        SELECTOR_ID_NAME,
+        SELECTOR_ID_PHONE,
+        SELECTOR_ID_RESULT_LINKS,
+        SELECTOR_ID_SEARCH_BOX,
+        SELECTOR_ID_WEBSITE,
+        TIMEOUT_EMAIL_BODY_WAIT,
+        TIMEOUT_EMAIL_HTTP,
+        TIMEOUT_EMAIL_PAGE_LOAD,
+        TIMEOUT_EXPLICIT_WAIT,
+        TIMEOUT_IMPLICIT_WAIT,
+        TIMEOUT_PAGE_LOAD,
+        USER_AGENT_CHROME,
+        VALIDATION_MODES,
+        VALIDATION_MODE_LENIENT,
+        VALIDATION_MODE_MODERATE,
+        VALIDATION_MODE_NONE,
+        VALIDATION_MODE_STRICT,
+        WORKER_COUNT
+    )
 except ImportError:
-    import constants as const
+    from constants import (
+        BACKOFF_FACTOR,
+        CHROMEDRIVER_PATH,
+        CSV_BUFFER_SIZE,
+        CSV_ENCODING,
+        BLOCKED_URLS_EMAIL,
+        BLOCKED_URLS_MAPS,
+        CSV_HEADERS,
+        CSV_HEADER_ALAMAT,
+        CSV_HEADER_DESKRIPSI,
+        CSV_HEADER_EMAIL,
+        CSV_HEADER_KOTA,
+        CSV_HEADER_LOGO,
+        CSV_HEADER_MAP_URL,
+        CSV_HEADER_NAMA,
+        CSV_HEADER_TELEPON,
+        CSV_HEADER_WEBSITE,
+        DATE_FORMAT,
+        DEFAULT_MAX_SCROLLS,
+        DELAY_AFTER_SEARCH,
+        DELAY_DETAIL_PAGE,
+        DELAY_RETRY_BASE,
+        DELAY_SCROLL_PAUSE,
+        DETAIL_CONCURRENCY,
+        EMAIL_BLACKLIST_SET,
+        EMAIL_CONCURRENCY,
+        EMAIL_HTTP_POOL_SIZE,
+        EMAIL_IMAGE_EXTENSIONS,
+        EMAIL_MAX_LENGTH,
+        EMAIL_MAX_PENDING,
+        EMAIL_MIN_HTML_LENGTH,
+        EMAIL_MIN_LENGTH,
+        EMAIL_SCAN_CHUNK_SIZE,
+        FLUSH_INTERVAL,
+        LOG_DATE_FORMAT,
+        LOG_FILE_NAME,
+        LOG_FORMAT,
+        LOG_LEVEL_DEFAULT,
+        MAX_LENGTH_ALAMAT,
+        MAX_LENGTH_DESKRIPSI,
+        MAX_LENGTH_EMAIL,
+        MAX_LENGTH_KOTA,
+        MAX_LENGTH_LOGO,
+        MAX_LENGTH_MAP_URL,
+        MAX_LENGTH_NAMA,
+        MAX_LENGTH_TELEPON,
+        MAX_LENGTH_WEBSITE,
+        MAX_RETRIES,
+        OUTPUT_DIR_NAME,
+        OUTPUT_FALLBACK_NAME,
+        PROGRESS_LOG_INTERVAL,
+        RESUME_FILE_SUFFIX,
+        RESUME_HASH_LENGTH,
+        RETRY_JITTER,
+        RETRY_MAX_DELAY,
+        SCROLL_PROGRESS_INTERVAL,
+        SELECTOR_ID_ADDRESS,
+        SELECTOR_ID_CATEGORY,
+        SELECTOR_ID_END_OF_LIST,
+        SELECTOR_ID_FEED,
+        SELECTOR_ID_LOGO,
+        SELECTOR_ID_MAILTO,
+        SELECTOR_ID_NAME,
+        SELECTOR_ID_PHONE,
+        SELECTOR_ID_RESULT_LINKS,
+        SELECTOR_ID_SEARCH_BOX,
+        SELECTOR_ID_WEBSITE,
+        TIMEOUT_EMAIL_BODY_WAIT,
+        TIMEOUT_EMAIL_HTTP,
+        TIMEOUT_EMAIL_PAGE_LOAD,
+        TIMEOUT_EXPLICIT_WAIT,
+        TIMEOUT_IMPLICIT_WAIT,
+        TIMEOUT_PAGE_LOAD,
+        USER_AGENT_CHROME,
+        VALIDATION_MODES,
+        VALIDATION_MODE_LENIENT,
+        VALIDATION_MODE_MODERATE,
+        VALIDATION_MODE_NONE,
+        VALIDATION_MODE_STRICT,
+        WORKER_COUNT
+    )
 
 
 class ScraperConfig:
@@ -36,91 +200,109 @@ class ScraperConfig:
     # SELENIUM SETTINGS
     # ========================================================================
     
-    USER_AGENT: Final[str] = const.USER_AGENT_CHROME
-    PAGE_LOAD_TIMEOUT: Final[int] = const.TIMEOUT_PAGE_LOAD
-    IMPLICIT_WAIT: Final[int] = const.TIMEOUT_IMPLICIT_WAIT
-    EXPLICIT_WAIT: Final[int] = const.TIMEOUT_EXPLICIT_WAIT
+    USER_AGENT: Final[str] = USER_AGENT_CHROME
+    CHROMEDRIVER_PATH: Final[str] = CHROMEDRIVER_PATH
+    
+    # Resource yang di-block via CDP (Maps tab / tab email finder)
+    BLOCKED_URLS_MAPS: Final[tuple] = BLOCKED_URLS_MAPS
+    BLOCKED_URLS_EMAIL: Final[tuple] = BLOCKED_URLS_EMAIL
+    
+    PAGE_LOAD_TIMEOUT: Final[int] = TIMEOUT_PAGE_LOAD
+    IMPLICIT_WAIT: Final[int] = TIMEOUT_IMPLICIT_WAIT
+    EXPLICIT_WAIT: Final[int] = TIMEOUT_EXPLICIT_WAIT
     
     # ========================================================================
     # SCRAPING SETTINGS
     # ========================================================================
     
-    DEFAULT_MAX_SCROLLS: Final[int] = const.DEFAULT_MAX_SCROLLS
-    SCROLL_PAUSE_TIME: Final[float] = const.DELAY_SCROLL_PAUSE
-    AFTER_SEARCH_DELAY: Final[float] = const.DELAY_AFTER_SEARCH
-    DETAIL_PAGE_DELAY: Final[float] = const.DELAY_DETAIL_PAGE
-    SCROLL_PROGRESS_INTERVAL: Final[int] = const.SCROLL_PROGRESS_INTERVAL
+    DEFAULT_MAX_SCROLLS: Final[int] = DEFAULT_MAX_SCROLLS
+    SCROLL_PAUSE_TIME: Final[float] = DELAY_SCROLL_PAUSE
+    AFTER_SEARCH_DELAY: Final[float] = DELAY_AFTER_SEARCH
+    DETAIL_PAGE_DELAY: Final[float] = DELAY_DETAIL_PAGE
+    SCROLL_PROGRESS_INTERVAL: Final[int] = SCROLL_PROGRESS_INTERVAL
+    PROGRESS_LOG_INTERVAL: Final[int] = PROGRESS_LOG_INTERVAL
+    DETAIL_CONCURRENCY: Final[int] = DETAIL_CONCURRENCY
+    WORKER_COUNT: Final[int] = WORKER_COUNT
     
     # ========================================================================
     # EMAIL FINDER SETTINGS
     # ========================================================================
     
-    EMAIL_PAGE_LOAD_TIMEOUT: Final[int] = const.TIMEOUT_EMAIL_PAGE_LOAD
-    EMAIL_BODY_WAIT: Final[int] = const.TIMEOUT_EMAIL_BODY_WAIT
-    EMAIL_BLACKLIST: Final[Tuple[str, ...]] = const.EMAIL_BLACKLIST
-    EMAIL_IMAGE_EXTENSIONS: Final[Tuple[str, ...]] = const.EMAIL_IMAGE_EXTENSIONS
-    EMAIL_MIN_LENGTH: Final[int] = const.EMAIL_MIN_LENGTH
-    EMAIL_MAX_LENGTH: Final[int] = const.EMAIL_MAX_LENGTH
+    EMAIL_PAGE_LOAD_TIMEOUT: Final[int] = TIMEOUT_EMAIL_PAGE_LOAD
+    EMAIL_BODY_WAIT: Final[int] = TIMEOUT_EMAIL_BODY_WAIT
+    EMAIL_HTTP_TIMEOUT: Final[int] = TIMEOUT_EMAIL_HTTP
+    EMAIL_BLACKLIST: Final[frozenset] = EMAIL_BLACKLIST_SET
+    EMAIL_IMAGE_EXTENSIONS: Final[Tuple[str, ...]] = EMAIL_IMAGE_EXTENSIONS
+    EMAIL_MIN_LENGTH: Final[int] = EMAIL_MIN_LENGTH
+    EMAIL_MAX_LENGTH: Final[int] = EMAIL_MAX_LENGTH
+    EMAIL_CONCURRENCY: Final[int] = EMAIL_CONCURRENCY
+    EMAIL_MIN_HTML_LENGTH: Final[int] = EMAIL_MIN_HTML_LENGTH
+    EMAIL_SCAN_CHUNK_SIZE: Final[int] = EMAIL_SCAN_CHUNK_SIZE
+    EMAIL_HTTP_POOL_SIZE: Final[int] = EMAIL_HTTP_POOL_SIZE
+    EMAIL_MAX_PENDING: Final[int] = EMAIL_MAX_PENDING
     
     # ========================================================================
     # RETRY SETTINGS
     # ========================================================================
     
-    MAX_RETRIES: Final[int] = const.MAX_RETRIES
-    RETRY_DELAY: Final[int] = const.DELAY_RETRY_BASE
-    BACKOFF_FACTOR: Final[int] = const.BACKOFF_FACTOR
+    MAX_RETRIES: Final[int] = MAX_RETRIES
+    RETRY_DELAY: Final[int] = DELAY_RETRY_BASE
+    BACKOFF_FACTOR: Final[int] = BACKOFF_FACTOR
+    RETRY_MAX_DELAY: Final[int] = RETRY_MAX_DELAY
+    RETRY_JITTER: Final[float] = RETRY_JITTER
     
     # ========================================================================
     # CSV SETTINGS
     # ========================================================================
     
-    CSV_HEADERS: Final[List[str]] = list(const.CSV_HEADERS)
-    CSV_ENCODING: Final[str] = const.CSV_ENCODING
-    FLUSH_INTERVAL: Final[int] = const.FLUSH_INTERVAL
+    CSV_HEADERS: Final[List[str]] = list(CSV_HEADERS)
+    CSV_ENCODING: Final[str] = CSV_ENCODING
+    CSV_BUFFER_SIZE: Final[int] = CSV_BUFFER_SIZE
+    FLUSH_INTERVAL: Final[int] = FLUSH_INTERVAL
     
     # ========================================================================
     # DATA VALIDATION SETTINGS
     # ========================================================================
     
     # Default validation mode
-    VALIDATION_MODE: str = const.VALIDATION_MODE_MODERATE
-    
-    # Field requirements untuk setiap mode
-    VALIDATION_RULES: Final[Dict[str, List[str]]] = {
-        const.VALIDATION_MODE_STRICT: [
-            const.CSV_HEADER_NAMA,
-            const.CSV_HEADER_ALAMAT,
-            const.CSV_HEADER_KOTA,
-            const.CSV_HEADER_TELEPON,
-            const.CSV_HEADER_DESKRIPSI,
-            const.CSV_HEADER_WEBSITE,
-            const.CSV_HEADER_LOGO,
-            const.CSV_HEADER_EMAIL,
-            const.CSV_HEADER_MAP_URL
-        ],
-        const.VALIDATION_MODE_MODERATE: [
-            const.CSV_HEADER_NAMA,
-            const.CSV_HEADER_WEBSITE,
-            const.CSV_HEADER_EMAIL
-        ],
-        const.VALIDATION_MODE_LENIENT: [
-            const.CSV_HEADER_NAMA,
-            const.CSV_HEADER_TELEPON
-        ],
-        const.VALIDATION_MODE_NONE: []
+    VALIDATION_MODE: str = VALIDATION_MODE_MODERATE
+    
+    # Field requirements untuk setiap mode (frozenset: validasi via set difference)
+    VALIDATION_RULES: Final[Dict[str, frozenset]] = {
+        VALIDATION_MODE_STRICT: frozenset([
+            CSV_HEADER_NAMA,
+            CSV_HEADER_ALAMAT,
+            CSV_HEADER_KOTA,
+            CSV_HEADER_TELEPON,
+            CSV_HEADER_DESKRIPSI,
+            CSV_HEADER_WEBSITE,
+            CSV_HEADER_LOGO,
+            CSV_HEADER_EMAIL,
+            CSV_HEADER_MAP_URL
+        ]),
+        VALIDATION_MODE_MODERATE: frozenset([
+            CSV_HEADER_NAMA,
+            CSV_HEADER_WEBSITE,
+            CSV_HEADER_EMAIL
+        ]),
+        VALIDATION_MODE_LENIENT: frozenset([
+            CSV_HEADER_NAMA,
+            CSV_HEADER_TELEPON
+        ]),
+        VALIDATION_MODE_NONE: frozenset()
     }
     
     # Maximum field lengths
     MAX_FIELD_LENGTH: Final[Dict[str, int]] = {
-        const.CSV_HEADER_NAMA: const.MAX_LENGTH_NAMA,
-        const.CSV_HEADER_ALAMAT: const.MAX_LENGTH_ALAMAT,
-        const.CSV_HEADER_KOTA: const.MAX_LENGTH_KOTA,
-        const.CSV_HEADER_TELEPON: const.MAX_LENGTH_TELEPON,
-        const.CSV_HEADER_DESKRIPSI: const.MAX_LENGTH_DESKRIPSI,
-        const.CSV_HEADER_WEBSITE: const.MAX_LENGTH_WEBSITE,
-        const.CSV_HEADER_LOGO: const.MAX_LENGTH_LOGO,
-        const.CSV_HEADER_EMAIL: const.MAX_LENGTH_EMAIL,
-        const.CSV_HEADER_MAP_URL: const.MAX_LENGTH_MAP_URL
+        CSV_HEADER_NAMA: MAX_LENGTH_NAMA,
+        CSV_HEADER_ALAMAT: MAX_LENGTH_ALAMAT,
+        CSV_HEADER_KOTA: MAX_LENGTH_KOTA,
+        CSV_HEADER_TELEPON: MAX_LENGTH_TELEPON,
+        CSV_HEADER_DESKRIPSI: MAX_LENGTH_DESKRIPSI,
+        CSV_HEADER_WEBSITE: MAX_LENGTH_WEBSITE,
+        CSV_HEADER_LOGO: MAX_LENGTH_LOGO,
+        CSV_HEADER_EMAIL: MAX_LENGTH_EMAIL,
+        CSV_HEADER_MAP_URL: MAX_LENGTH_MAP_URL
     }
     
     # ========================================================================
@@ -128,46 +310,60 @@ class ScraperConfig:
     # ========================================================================
     
     SELECTORS: Final[Dict[str, Tuple[By, str] | str]] = {
-        const.SELECTOR_ID_SEARCH_BOX: (By.ID, "searchboxinput"),
-        const.SELECTOR_ID_FEED: "//div[@role='feed']",
-        const.SELECTOR_ID_RESULT_LINKS: "div[role='feed'] a.hfpxzc",
-        const.SELECTOR_ID_END_OF_LIST: (
+        SELECTOR_ID_SEARCH_BOX: (By.ID, "searchboxinput"),
+        SELECTOR_ID_FEED: "div[role='feed']",
+        SELECTOR_ID_RESULT_LINKS: "div[role='feed'] a.hfpxzc",
+        SELECTOR_ID_END_OF_LIST: (
             "//span[contains(text(), 'You have reached the end of the list') or "
             "contains(text(), 'Anda telah mencapai akhir daftar')]"
         ),
-        const.SELECTOR_ID_NAME: "//h1",
-        const.SELECTOR_ID_ADDRESS: (
+        SELECTOR_ID_NAME: "//h1",
+        SELECTOR_ID_ADDRESS: (
             "//button[contains(@aria-label, 'Address') or "
             "contains(@aria-label, 'Alamat')]"
         ),
-        const.SELECTOR_ID_PHONE: (
+        SELECTOR_ID_PHONE: (
             "//button[contains(@aria-label, 'Phone') or "
             "contains(@aria-label, 'Telepon')]"
         ),
-        const.SELECTOR_ID_CATEGORY: "//button[contains(@jsaction, 'pane.rating.category')]",
-        const.SELECTOR_ID_WEBSITE: (
+        SELECTOR_ID_CATEGORY: "//button[contains(@jsaction, 'pane.rating.category')]",
+        SELECTOR_ID_WEBSITE: (
             "//a[contains(@aria-label, 'Website') or "
             "contains(@data-item-id, 'authority')]"
         ),
-        const.SELECTOR_ID_LOGO: "//button[contains(@jsaction, 'hero')]/img",
-        const.SELECTOR_ID_MAILTO: "//a[starts-with(@href, 'mailto:')]"
+        SELECTOR_ID_LOGO: "//button[contains(@jsaction, 'hero')]/img",
+        SELECTOR_ID_MAILTO: "a[href^='mailto:']"
+    }
+    
+    # Field detail page: CSV header -> (selector ID, attribute)
+    # Attribute None = ambil text content
+    DETAIL_FIELDS: Final[Dict[str, Tuple[str, Optional[str]]]] = {
+        CSV_HEADER_NAMA: (SELECTOR_ID_NAME, None),
+        CSV_HEADER_ALAMAT: (SELECTOR_ID_ADDRESS, 'aria-label'),
+        CSV_HEADER_TELEPON: (SELECTOR_ID_PHONE, 'aria-label'),
+        CSV_HEADER_DESKRIPSI: (SELECTOR_ID_CATEGORY, None),
+        CSV_HEADER_WEBSITE: (SELECTOR_ID_WEBSITE, 'href'),
+        CSV_HEADER_LOGO: (SELECTOR_ID_LOGO, 'src')
     }
     
     # ========================================================================
     # LOGGING SETTINGS
     # ========================================================================
     
-    LOG_FORMAT: Final[str] = const.LOG_FORMAT
-    LOG_DATE_FORMAT: Final[str] = const.LOG_DATE_FORMAT
-    LOG_LEVEL: Final[str] = const.LOG_LEVEL_DEFAULT
-    LOG_FILE_NAME: Final[str] = const.LOG_FILE_NAME
+    LOG_FORMAT: Final[str] = LOG_FORMAT
+    LOG_DATE_FORMAT: Final[str] = LOG_DATE_FORMAT
+    LOG_LEVEL: Final[str] = LOG_LEVEL_DEFAULT
+    LOG_FILE_NAME: Final[str] = LOG_FILE_NAME
     
     # ========================================================================
     # OUTPUT SETTINGS
     # ========================================================================
     
-    OUTPUT_DIR: Final[str] = const.OUTPUT_DIR_NAME
-    DATE_FORMAT: Final[str] = const.DATE_FORMAT
+    OUTPUT_DIR: Final[str] = OUTPUT_DIR_NAME
+    DATE_FORMAT: Final[str] = DATE_FORMAT
+    OUTPUT_FALLBACK_NAME: Final[str] = OUTPUT_FALLBACK_NAME
+    RESUME_FILE_SUFFIX: Final[str] = RESUME_FILE_SUFFIX
+    RESUME_HASH_LENGTH: Final[int] = RESUME_HASH_LENGTH
     
     # ========================================================================
     # CLASS METHODS
@@ -186,6 +382,22 @@ class ScraperConfig:
         
         Note:
             Options ini dirancang untuk menghindari deteksi sebagai bot.
+            Template di-build sekali per mode (cached). Setiap call dapat
+            deep copy karena Selenium butuh Options baru per driver.
+        """
+        return copy.deepcopy(cls._build_options_template(headless))
+    
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _build_options_template(cls, headless: bool) -> Options:
+        """
+        Build Chrome options template (di-cache per headless flag).
+        
+        Args:
+            headless: Jika True, run browser tanpa UI
+        
+        Returns:
+            Options template, jangan dimodifikasi langsung
         """
         options = Options()
         
@@ -201,6 +413,36 @@ class ScraperConfig:
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Bandwidth: jangan download images, block notification prompt
+        # (logo tetap bisa diambil dari attribute src tanpa load image)
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        
+        # Matikan fetch spekulatif yang tidak dibutuhkan scraper.
+        # Chrome hanya membaca --disable-features terakhir → semua dalam satu flag.
+        # Site isolation sengaja tetap aktif: email fallback membuka website
+        # pihak ketiga sembarang (headless juga jalan dengan --no-sandbox)
+        options.add_argument('--disable-features=TranslateUI,MediaRouter')
+        options.add_argument('--disable-background-networking')
+        
+        # Cold-start: matikan background services yang tidak dipakai scraper
+        options.add_argument('--disable-component-update')
+        options.add_argument('--disable-sync')
+        options.add_argument('--disable-default-apps')
+        options.add_argument('--no-first-run')
+        options.add_argument('--no-default-browser-check')
+        options.add_argument('--metrics-recording-only')
+        options.add_argument('--mute-audio')
+        options.add_argument('--log-level=3')  # Hanya log fatal dari Chrome
+        
+        # Jangan throttle tab/timer di background (tab email finder, window tertutup)
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-backgrounding-occluded-windows')
+        options.add_argument('--disable-renderer-backgrounding')
+        
         # Page load strategy: 'eager' = don't wait for images/css
         options.page_load_strategy = 'eager'
         
@@ -214,6 +456,61 @@ class ScraperConfig:
         return options
     
     @classmethod
+    def get_compiled(cls, selector_id: str) -> etree.XPath:
+        """
+        Get precompiled lxml XPath untuk selector tertentu.
+        
+        Args:
+            selector_id: Salah satu const.SELECTOR_ID_*
+        
+        Returns:
+            Callable etree.XPath, panggil dengan lxml tree: compiled(tree)
+        
+        Raises:
+            KeyError: Jika selector tidak punya compiled version
+                (contoh: search_box yang berupa (By, value) tuple)
+        
+        Note:
+            String mentah di SELECTORS tetap dipakai untuk Selenium.
+            Versi compiled dipakai untuk parsing langsung page_source via lxml.
+        """
+        return _COMPILED_SELECTORS[selector_id]
+    
+    @classmethod
+    def get_locator(cls, selector_id: str) -> Tuple[str, str]:
+        """
+        Get Selenium locator (By strategy, value) untuk selector tertentu.
+        
+        Strategy ditentukan sekali saat import: XPath (diawali "//") lewat
+        By.XPATH, selain itu By.CSS_SELECTOR (querySelectorAll di browser).
+        
+        Args:
+            selector_id: Salah satu const.SELECTOR_ID_*
+        
+        Returns:
+            Tuple (By.*, value), siap dipakai find_element(*locator) atau EC.*
+        """
+        return _SELECTOR_LOCATORS[selector_id]
+    
+    @classmethod
+    def get_xpath(cls, selector_id: str) -> str:
+        """
+        Get XPath string untuk selector tertentu.
+        CSS selector dikembalikan dalam bentuk XPath hasil translate.
+        
+        Args:
+            selector_id: Salah satu const.SELECTOR_ID_*
+        
+        Returns:
+            XPath expression string
+        
+        Raises:
+            KeyError: Jika selector berupa (By, value) tuple
+        """
+        return _RESOLVED_SELECTORS[selector_id]
+    
+    @classmethod
+    @lru_cache(maxsize=1)
     def create_output_dir(cls) -> Path:
         """
         Buat folder output jika belum ada.
@@ -223,6 +520,10 @@ class ScraperConfig:
         
         Raises:
             OSError: Jika gagal create directory
+        
+        Note:
+            Hasil di-cache: mkdir (dan stat-nya) hanya jalan sekali per process.
+            Gagal (OSError) tidak di-cache sehingga pemanggilan berikutnya retry.
         """
         output_path = Path(cls.OUTPUT_DIR)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -241,10 +542,10 @@ class ScraperConfig:
         """
         try:
             # Check validation mode
-            if cls.VALIDATION_MODE not in const.VALIDATION_MODES:
+            if cls.VALIDATION_MODE not in VALIDATION_MODES:
                 print(f"⚠️  Warning: Invalid VALIDATION_MODE '{cls.VALIDATION_MODE}'. "
-                      f"Using default: {const.VALIDATION_MODE_MODERATE}")
-                cls.VALIDATION_MODE = const.VALIDATION_MODE_MODERATE
+                      f"Using default: {VALIDATION_MODE_MODERATE}")
+                cls.VALIDATION_MODE = VALIDATION_MODE_MODERATE
             
             # Check numeric values
             if cls.DEFAULT_MAX_SCROLLS < 1:
@@ -270,13 +571,13 @@ class ScraperConfig:
             Dictionary dengan mode sebagai key dan deskripsi sebagai value
         """
         return {
-            const.VALIDATION_MODE_STRICT: 
+            VALIDATION_MODE_STRICT: 
                 "Semua field wajib terisi (~10-20% data tersimpan)",
-            const.VALIDATION_MODE_MODERATE: 
+            VALIDATION_MODE_MODERATE: 
                 "Minimal: nama, website, email (~20-30% data tersimpan) [RECOMMENDED]",
-            const.VALIDATION_MODE_LENIENT: 
+            VALIDATION_MODE_LENIENT: 
                 "Minimal: nama, telepon (~80-90% data tersimpan)",
-            const.VALIDATION_MODE_NONE: 
+            VALIDATION_MODE_NONE: 
                 "Simpan semua data tanpa filter (~100% data tersimpan)"
         }
     
@@ -294,5 +595,68 @@ class ScraperConfig:
         print("="*70 + "\n")
 
 
-# Initialize and validate config on module load
-ScraperConfig.validate_config()
+# ============================================================================
+# PRECOMPILED SELECTORS
+# ============================================================================
+
+_CSS_TRANSLATOR = HTMLTranslator()
+
+
+@lru_cache(maxsize=64)
+def _css_to_xpath(css: str) -> str:
+    """
+    Translate CSS selector ke XPath (hasil di-cache).
+    
+    Args:
+        css: CSS selector string
+    
+    Returns:
+        XPath expression hasil translate cssselect
+    """
+    return _CSS_TRANSLATOR.css_to_xpath(css)
+
+
+def _resolve_xpath(selector: str) -> str:
+    """
+    Resolve selector string (XPath atau CSS) menjadi XPath.
+    
+    Args:
+        selector: XPath (diawali "//") atau CSS selector
+    
+    Returns:
+        XPath expression
+    """
+    if selector.startswith("//"):
+        return selector
+    return _css_to_xpath(selector)
+
+
+# Selector ID -> XPath string. CSS selector sudah di-translate saat import,
+# jadi consumer tidak pernah bayar biaya translate di runtime
+_RESOLVED_SELECTORS: Final[Dict[str, str]] = {
+    selector_id: _resolve_xpath(selector)
+    for selector_id, selector in ScraperConfig.SELECTORS.items()
+    if isinstance(selector, str)
+}
+
+# Selector ID -> (By strategy, value) untuk Selenium, dispatch di-resolve sekali
+_SELECTOR_LOCATORS: Final[Dict[str, Tuple[str, str]]] = {
+    selector_id: (
+        selector if isinstance(selector, tuple)
+        else (By.XPATH, selector) if selector.startswith("//")
+        else (By.CSS_SELECTOR, selector)
+    )
+    for selector_id, selector in ScraperConfig.SELECTORS.items()
+}
+
+# Compile sekali saat import, bukan setiap kali selector dipakai
+_COMPILED_SELECTORS: Final[Dict[str, etree.XPath]] = {
+    selector_id: etree.XPath(xpath)
+    for selector_id, xpath in _RESOLVED_SELECTORS.items()
+}
+
+# Versi XPath string untuk dievaluasi langsung di browser (document.evaluate)
+DETAIL_FIELD_QUERIES: Final[Tuple[Tuple[str, str, Optional[str]], ...]] = tuple(
+    (header, _RESOLVED_SELECTORS[selector_id], attribute)
+    for header, (selector_id, attribute) in ScraperConfig.DETAIL_FIELDS.items()
+)
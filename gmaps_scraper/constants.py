@@ -9,8 +9,42 @@ Author: rotiawan
 Date: 2025-11-22
 """
 
+import os
+import re
 from typing import Final
 
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """
+    Baca override integer dari environment variable.
+    
+    Sama seperti ScraperConfig.validate_config: nilai invalid tidak membuat
+    import gagal, tapi di-warn lalu kembali ke default.
+    
+    Args:
+        name: Nama environment variable
+        default: Nilai jika tidak di-set atau invalid
+        minimum: Nilai minimal yang diterima
+    
+    Returns:
+        Integer dari environment variable, atau default
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    
+    try:
+        value = int(raw)
+    except ValueError:
+        print(f"⚠️  Warning: {name} must be an integer, got '{raw}'. Using {default}.")
+        return default
+    
+    if value < minimum:
+        print(f"⚠️  Warning: {name} must be >= {minimum}. Using {default}.")
+        return default
+    
+    return value
+
 # ============================================================================
 # APPLICATION CONSTANTS
 # ============================================================================
@@ -29,11 +63,13 @@ GOOGLE_MAPS_URL: Final[str] = "https://www.google.com/maps"
 # TIMEOUT CONSTANTS (in seconds)
 # ============================================================================
 
-TIMEOUT_PAGE_LOAD: Final[int] = 300
+# Listing yang tidak load dalam 30s praktis tidak akan pulih; override via env var
+TIMEOUT_PAGE_LOAD: Final[int] = _env_int("GMAPS_PAGE_LOAD_TIMEOUT", 30)
 TIMEOUT_IMPLICIT_WAIT: Final[int] = 10
 TIMEOUT_EXPLICIT_WAIT: Final[int] = 20
 TIMEOUT_EMAIL_PAGE_LOAD: Final[int] = 10
 TIMEOUT_EMAIL_BODY_WAIT: Final[int] = 7
+TIMEOUT_EMAIL_HTTP: Final[int] = 5  # requests.get ke website bisnis (tanpa browser)
 
 # ============================================================================
 # DELAY CONSTANTS (in seconds)
@@ -50,6 +86,8 @@ DELAY_RETRY_BASE: Final[int] = 2
 
 MAX_RETRIES: Final[int] = 3
 BACKOFF_FACTOR: Final[int] = 2
+RETRY_MAX_DELAY: Final[int] = 30  # Batas atas sleep antar retry (detik)
+RETRY_JITTER: Final[float] = 0.5  # Sleep dikali 1 + U(0, jitter) agar retry tidak serempak
 
 # ============================================================================
 # SCRAPING CONSTANTS
@@ -57,7 +95,15 @@ BACKOFF_FACTOR: Final[int] = 2
 
 DEFAULT_MAX_SCROLLS: Final[int] = 15
 SCROLL_PROGRESS_INTERVAL: Final[int] = 5  # Log setiap N scrolls
-FLUSH_INTERVAL: Final[int] = 10  # Flush CSV setiap N rows
+# Log progress scraping setiap N row tersimpan (row terakhir selalu di-log).
+# 1 = log setiap row, override via env var untuk run besar
+PROGRESS_LOG_INTERVAL: Final[int] = _env_int("GMAPS_PROGRESS_EVERY", 1)
+DETAIL_CONCURRENCY: Final[int] = 4  # Jumlah detail page yang di-load paralel (satu tab per page)
+# Jumlah worker process (masing-masing 1 browser). 1 = tanpa pool, override via env var
+WORKER_COUNT: Final[int] = _env_int("GMAPS_WORKERS", 1)
+# Flush CSV manual setiap N rows. 0 = tidak pernah flush manual, andalkan
+# block buffering dari OS (lebih cepat, tapi row terakhir bisa hilang jika crash)
+FLUSH_INTERVAL: Final[int] = 0
 
 # ============================================================================
 # DATA VALIDATION CONSTANTS
@@ -83,6 +129,19 @@ VALIDATION_MODES: Final[tuple] = (
 
 EMAIL_MIN_LENGTH: Final[int] = 5
 EMAIL_MAX_LENGTH: Final[int] = 256
+# Hasil validate_email di-cache (footer email yang sama muncul di banyak halaman)
+EMAIL_VALIDATION_CACHE_SIZE: Final[int] = 4096
+
+# Email finder concurrency
+EMAIL_CONCURRENCY: Final[int] = 8  # Jumlah website yang di-fetch paralel via HTTP
+# HTML hasil HTTP fetch yang lebih pendek dari ini dianggap JS SPA → fallback ke Selenium
+EMAIL_MIN_HTML_LENGTH: Final[int] = 2048
+# Ukuran chunk download saat scan HTML website untuk email (streaming)
+EMAIL_SCAN_CHUNK_SIZE: Final[int] = 65536
+# Connection pool per host untuk requests.Session email finder
+EMAIL_HTTP_POOL_SIZE: Final[int] = 32
+# Maksimal row yang menunggu hasil email lookup sebelum scraping detail di-pause
+EMAIL_MAX_PENDING: Final[int] = 32
 
 # Email blacklist - domain dummy yang sering ditemukan di template
 EMAIL_BLACKLIST: Final[tuple] = (
@@ -107,6 +166,15 @@ EMAIL_IMAGE_EXTENSIONS: Final[tuple] = (
     '.ico'
 )
 
+# Set version untuk O(1) membership lookup per domain
+EMAIL_BLACKLIST_SET: Final[frozenset] = frozenset(EMAIL_BLACKLIST)
+
+# Satu regex untuk semua image extension di akhir email candidate
+EMAIL_IMAGE_EXT_RE: Final[re.Pattern] = re.compile(
+    r'\.(?:' + '|'.join(re.escape(ext.lstrip('.')) for ext in EMAIL_IMAGE_EXTENSIONS) + r')$',
+    re.IGNORECASE
+)
+
 # ============================================================================
 # REGEX PATTERNS
 # ============================================================================
@@ -115,18 +183,84 @@ EMAIL_IMAGE_EXTENSIONS: Final[tuple] = (
 EMAIL_PATTERN: Final[str] = r'^[a-zA-Z0-9][a-zA-Z0-9._%+-]{0,63}@[a-zA-Z0-9][a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 EMAIL_EXTRACT_PATTERN: Final[str] = r'[a-zA-Z0-9][a-zA-Z0-9._%+-]{0,63}@[a-zA-Z0-9][a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
 
+# Compiled sekali saat import (hindari re-parse pattern di hot path)
+EMAIL_RE: Final[re.Pattern] = re.compile(EMAIL_PATTERN)
+EMAIL_EXTRACT_RE: Final[re.Pattern] = re.compile(EMAIL_EXTRACT_PATTERN)
+
+# Extract + reject dalam satu pass: blacklist domain (termasuk subdomain) ditolak
+# via lookahead setelah '@', image extension via lookbehind di akhir match.
+# Di-generate dari EMAIL_BLACKLIST / EMAIL_IMAGE_EXTENSIONS agar selalu sinkron.
+_EMAIL_BLACKLIST_ALT: Final[str] = '|'.join(re.escape(d) for d in EMAIL_BLACKLIST)
+# Python re hanya support fixed-width lookbehind → satu lookbehind per extension
+_EMAIL_IMAGE_LOOKBEHINDS: Final[str] = ''.join(
+    rf'(?<!{re.escape(ext)})' for ext in EMAIL_IMAGE_EXTENSIONS
+)
+# Semua quantifier dibatasi sesuai RFC (label 63, domain 253) sehingga kerja
+# per '@' konstan dan scan tetap linear pada page_source yang adversarial.
+# (RE2 tidak dipakai: tidak support lookaround yang dibutuhkan di sini.)
+EMAIL_COMBINED_PATTERN: Final[str] = (
+    r'[a-zA-Z0-9][a-zA-Z0-9._%+-]{0,63}@'
+    # Domain bukan (sub)domain blacklist; boundary: bukan diikuti label lain
+    r'(?!(?:[a-zA-Z0-9-]{1,63}\.){0,8}'
+    rf'(?:{_EMAIL_BLACKLIST_ALT})(?![a-zA-Z0-9-]|\.[a-zA-Z0-9]))'
+    r'[a-zA-Z0-9][a-zA-Z0-9.-]{0,251}\.[a-zA-Z]{2,63}'
+    # TLD harus maksimal, supaya "logo.png" tidak lolos sebagai "logo.pn"
+    r'(?![a-zA-Z0-9_-])'
+    + _EMAIL_IMAGE_LOOKBEHINDS
+)
+EMAIL_COMBINED_RE: Final[re.Pattern] = re.compile(EMAIL_COMBINED_PATTERN, re.IGNORECASE)
+
+# Email yang di-obfuscate untuk menghindari bot: "info [at] domain [dot] com".
+# Hanya bentuk ber-bracket yang dikenali, agar kalimat biasa ("meet us at ...")
+# tidak terbaca sebagai email.
+_EMAIL_OBFUSCATED_AT: Final[str] = r'\s{0,3}(?:\[at\]|\(at\)|\{at\}|\[@\]|\(@\))\s{0,3}'
+EMAIL_OBFUSCATED_DOT_PATTERN: Final[str] = r'\s{0,3}(?:\[dot\]|\(dot\)|\{dot\})\s{0,3}'
+EMAIL_OBFUSCATED_PATTERN: Final[str] = (
+    r'(?<![a-zA-Z0-9._%+-])([a-zA-Z0-9][a-zA-Z0-9._%+-]{0,63})'
+    + _EMAIL_OBFUSCATED_AT
+    + rf'((?:[a-zA-Z0-9-]{{1,63}}(?:{EMAIL_OBFUSCATED_DOT_PATTERN}|\.)){{1,8}}[a-zA-Z]{{2,63}})'
+    r'(?![a-zA-Z0-9-])'
+)
+EMAIL_OBFUSCATED_RE: Final[re.Pattern] = re.compile(EMAIL_OBFUSCATED_PATTERN, re.IGNORECASE)
+EMAIL_OBFUSCATED_DOT_RE: Final[re.Pattern] = re.compile(
+    EMAIL_OBFUSCATED_DOT_PATTERN, re.IGNORECASE
+)
+
+# Titik potong segmen HTTP untuk chunk tanpa tag: karakter terakhir yang tidak
+# pernah ada di dalam alamat email / mailto (greedy .* → match berakhir di
+# delimiter terakhir)
+EMAIL_SEGMENT_CUT_PATTERN: Final[str] = r'.*[\s"\',]'
+EMAIL_SEGMENT_CUT_RE: Final[re.Pattern] = re.compile(EMAIL_SEGMENT_CUT_PATTERN, re.DOTALL)
+
+# Alamat dari link mailto: di raw HTML (berhenti di quote, query string, atau spasi).
+# Numeric entity (&#64; = '@') ikut di-capture, lazim dipakai untuk obfuscation
+MAILTO_PATTERN: Final[str] = r'mailto:((?:[^"\'?&<>\s]|&#[xX]?[0-9a-fA-F]{1,6};)+)'
+MAILTO_RE: Final[re.Pattern] = re.compile(MAILTO_PATTERN, re.IGNORECASE)
+
 # Phone number cleanup pattern
 PHONE_CLEANUP_PATTERN: Final[str] = r'[^\d+\s()-]'
+PHONE_CLEANUP_RE: Final[re.Pattern] = re.compile(PHONE_CLEANUP_PATTERN)
 
 # Filename sanitization pattern
+# Karakter di luar ASCII alphanumeric/spasi/hyphen/underscore → underscore
+FILENAME_STRIP_PATTERN: Final[str] = r'[^A-Za-z0-9 _-]+'
+FILENAME_STRIP_RE: Final[re.Pattern] = re.compile(FILENAME_STRIP_PATTERN)
 FILENAME_ALLOWED_CHARS_PATTERN: Final[str] = r'[_\s]+'
+FILENAME_ALLOWED_CHARS_RE: Final[re.Pattern] = re.compile(FILENAME_ALLOWED_CHARS_PATTERN)
 
 # ============================================================================
 # CSV/FILE CONSTANTS
 # ============================================================================
 
 CSV_ENCODING: Final[str] = 'utf-8-sig'  # UTF-8 with BOM for Excel compatibility
+CSV_BUFFER_SIZE: Final[int] = 1 << 20  # 1 MiB write buffer, ganti default 8 KiB
 OUTPUT_DIR_NAME: Final[str] = "results"
+# Nama file jika query tidak menyisakan karakter aman (contoh query non-Latin)
+OUTPUT_FALLBACK_NAME: Final[str] = "query"
+# Resume log per query: URL detail page yang sudah selesai di run yang terputus.
+# Nama file memakai hash query asli (sanitize_filename lossy → bisa bentrok)
+RESUME_FILE_SUFFIX: Final[str] = ".done"
+RESUME_HASH_LENGTH: Final[int] = 12  # Jumlah hex digit SHA-1 query di nama file
 DATE_FORMAT: Final[str] = "%Y%m%d_%H%M%S"
 LOG_FILE_NAME: Final[str] = "scraper.log"
 
@@ -176,6 +310,13 @@ LOG_FORMAT: Final[str] = '%(asctime)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT: Final[str] = '%Y-%m-%d %H:%M:%S'
 LOG_LEVEL_DEFAULT: Final[str] = 'INFO'
 
+# ============================================================================
+# WEBDRIVER CONSTANTS
+# ============================================================================
+
+# Path chromedriver lokal (pinned). Kosong = resolve via webdriver-manager
+CHROMEDRIVER_PATH: Final[str] = os.environ.get("GMAPS_CHROMEDRIVER", "")
+
 # ============================================================================
 # USER AGENT CONSTANTS
 # ============================================================================
@@ -186,6 +327,71 @@ USER_AGENT_CHROME: Final[str] = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+# ============================================================================
+# JAVASCRIPT SNIPPETS
+# ============================================================================
+
+# Evaluasi semua field detail page di browser dalam satu execute_script.
+# arguments[0] = [[header, xpath, attribute|null], ...] → {header: raw value}
+JS_EXTRACT_DETAIL_FIELDS: Final[str] = """
+const fields = {};
+for (const [header, xpath, attribute] of arguments[0]) {
+    const node = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    let value = '';
+    if (node) {
+        value = attribute ? node.getAttribute(attribute) : node.textContent;
+    }
+    fields[header] = value || '';
+}
+return fields;
+"""
+
+# True jika XPath arguments[0] sudah match minimal satu node (tanpa implicit wait)
+JS_XPATH_EXISTS: Final[str] = (
+    "return document.evaluate(arguments[0], document, null, "
+    "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;"
+)
+
+# Cek end-of-list marker (XPath arguments[1]) lalu scroll element arguments[0]
+# ke bawah jika belum habis, satu round-trip. Return true jika marker ada
+JS_SCROLL_UNTIL_END: Final[str] = (
+    "var end = document.evaluate(arguments[1], document, null, "
+    "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;"
+    "if (!end) { arguments[0].scrollTop = arguments[0].scrollHeight; }"
+    "return end;"
+)
+
+# Rendered text seluruh halaman (tanpa tag), satu round-trip
+JS_BODY_TEXT: Final[str] = "return document.body ? document.body.innerText : '';"
+
+# href (absolute) semua element yang match CSS selector arguments[0], satu round-trip
+JS_COLLECT_HREFS: Final[str] = (
+    "return Array.from(document.querySelectorAll(arguments[0]))"
+    ".map(a => a.href).filter(Boolean);"
+)
+
+# ============================================================================
+# BLOCKED RESOURCE CONSTANTS (CDP Network.setBlockedURLs)
+# ============================================================================
+
+# Resource yang tidak pernah dibaca scraper (logo cukup dari attribute src)
+BLOCKED_URLS_MAPS: Final[tuple] = (
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm'
+)
+# Analytics/ads pihak ketiga yang sering dipasang di website bisnis
+BLOCKED_URLS_TRACKERS: Final[tuple] = (
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*connect.facebook.net*', '*hotjar.com*'
+)
+# Tab email finder hanya butuh HTML/DOM → CSS dan tracker ikut di-block
+BLOCKED_URLS_EMAIL: Final[tuple] = (
+    BLOCKED_URLS_MAPS + ('*.css', '*.svg', '*.ico') + BLOCKED_URLS_TRACKERS
+)
+
 # ============================================================================
 # XPATH/CSS SELECTORS IDs
 # ============================================================================
@@ -209,6 +415,7 @@ SELECTOR_ID_MAILTO: Final[str] = "mailto_links"
 ERROR_NO_LINKS_FOUND: Final[str] = "Tidak ada link ditemukan. Proses berhenti."
 ERROR_EMPTY_QUERY: Final[str] = "Query pencarian tidak boleh kosong!"
 ERROR_INVALID_SCROLL: Final[str] = "Minimal scroll adalah 1"
+ERROR_INVALID_WORKERS: Final[str] = "Minimal worker adalah 1"
 ERROR_INVALID_INPUT: Final[str] = "Input tidak valid, masukkan angka!"
 ERROR_WEBDRIVER_SETUP: Final[str] = "Gagal setup WebDriver"
 
@@ -9,6 +9,9 @@ Author: rotiawan
 Date: 2025-11-22
 """
 
+import logging
+from functools import wraps
+
 
 class ScraperBaseException(Exception):
     """
@@ -134,27 +137,24 @@ def handle_scraper_exception(default_return=None, log_error=True):
             # ... code that might raise exception
             pass
     """
-    from functools import wraps
-    
     def decorator(func):
+        # Logger dan nama function di-resolve sekali saat decorate,
+        # bukan di setiap exception
+        logger = logging.getLogger(func.__module__)
+        name = func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except ScraperBaseException as e:
                 if log_error:
-                    import logging
-                    logger = logging.getLogger(func.__module__)
-                    logger.error(f"ScraperException in {func.__name__}: {e}")
+                    # %-style: formatting hanya terjadi jika level ERROR aktif
+                    logger.error("ScraperException in %s: %s", name, e)
                 return default_return
             except Exception as e:
                 if log_error:
-                    import logging
-                    logger = logging.getLogger(func.__module__)
-                    logger.error(
-                        f"Unexpected error in {func.__name__}: {e}",
-                        exc_info=True
-                    )
+                    logger.error("Unexpected error in %s: %s", name, e, exc_info=True)
                 return default_return
         return wrapper
     return decorator
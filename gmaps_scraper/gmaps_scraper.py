@@ -23,14 +23,33 @@ Date: 2025-11-22
 Version: 18.0.0
 """
 
+import os
 import csv
 import time
+import hashlib
+import queue
+import atexit
 import signal
 import sys
 import logging
+import logging.handlers
+import threading
+import multiprocessing
+import multiprocessing.util
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple
+from html import unescape
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, List, Dict, Tuple, Iterator, Deque
 from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -39,7 +58,12 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException
+)
 
 # Import local modules
 # Support both direct script execution and package import
@@ -56,15 +80,20 @@ try:
     )
     from .utils import (
         retry_on_failure,
-        safe_find_element,
         validate_email,
         extract_email_from_text,
+        extract_obfuscated_email,
         extract_city_from_address,
+        fetch_detail_fields,
         sanitize_filename,
+        load_done_links,
+        append_done_links,
         close_extra_tabs,
+        block_urls,
+        wait_for_selector,
         scroll_element,
         format_phone_number,
-        validate_data,
+        make_validator,
         truncate_fields,
         ProgressTracker,
         DataStatistics
@@ -82,34 +111,86 @@ except ImportError:
     )
     from utils import (
         retry_on_failure,
-        safe_find_element,
         validate_email,
         extract_email_from_text,
+        extract_obfuscated_email,
         extract_city_from_address,
+        fetch_detail_fields,
         sanitize_filename,
+        load_done_links,
+        append_done_links,
         close_extra_tabs,
+        block_urls,
+        wait_for_selector,
         scroll_element,
         format_phone_number,
-        validate_data,
+        make_validator,
         truncate_fields,
         ProgressTracker,
         DataStatistics
     )
 
 # Setup logging
-logging.basicConfig(
-    level=getattr(logging, ScraperConfig.LOG_LEVEL),
-    format=ScraperConfig.LOG_FORMAT,
-    datefmt=ScraperConfig.LOG_DATE_FORMAT,
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(
-            ScraperConfig.LOG_FILE_NAME,
-            encoding='utf-8',
-            mode='a'
-        )
-    ]
+# Root logger hanya memasukkan record ke queue; write ke stdout/file
+# dilakukan QueueListener di background thread (bukan di hot path)
+_log_handlers = (
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler(
+        ScraperConfig.LOG_FILE_NAME,
+        encoding='utf-8',
+        mode='a'
+    )
 )
+_log_formatter = logging.Formatter(ScraperConfig.LOG_FORMAT, ScraperConfig.LOG_DATE_FORMAT)
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_listener_pid: Optional[int] = None
+
+
+def _start_log_listener() -> None:
+    """
+    Start QueueListener untuk process ini (idempotent per process).
+    
+    Note:
+        Worker hasil fork mewarisi handler tapi tidak thread listener-nya,
+        jadi worker memanggil ini lagi dengan queue baru (queue warisan
+        bisa membawa lock yang sedang dipegang listener parent).
+    """
+    global _log_listener, _log_listener_pid
+    
+    if _log_listener_pid == os.getpid():
+        return
+    
+    _log_queue_handler.queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue_handler.queue,
+        *_log_handlers
+    )
+    _log_listener.start()
+    _log_listener_pid = os.getpid()
+
+
+def _stop_log_listener() -> None:
+    """Flush sisa record di queue lalu stop QueueListener (idempotent)."""
+    global _log_listener, _log_listener_pid
+    
+    if _log_listener and _log_listener_pid == os.getpid():
+        _log_listener.stop()
+    _log_listener = None
+    _log_listener_pid = None
+
+
+# Sama seperti basicConfig: tidak override konfigurasi logging yang sudah ada
+if not logging.root.handlers:
+    logging.root.setLevel(getattr(logging, ScraperConfig.LOG_LEVEL))
+    logging.root.addHandler(_log_queue_handler)
+    _start_log_listener()
+    # Didaftarkan setelah logging → jalan sebelum logging.shutdown()
+    atexit.register(_stop_log_listener)
+
 logger = logging.getLogger(__name__)
 
 # Global flag untuk graceful shutdown
@@ -133,18 +214,44 @@ def signal_handler(signum: int, frame) -> None:
 signal.signal(signal.SIGINT, signal_handler)
 
 
+@lru_cache(maxsize=1)
+def _get_driver_path() -> str:
+    """
+    Resolve path chromedriver sekali per process.
+    
+    ChromeDriverManager().install() cek versi browser (dan bisa download)
+    setiap dipanggil, jadi hasilnya di-cache untuk semua scraper instance.
+    GMAPS_CHROMEDRIVER men-skip webdriver-manager sama sekali.
+    
+    Returns:
+        Path ke executable chromedriver
+    """
+    if ScraperConfig.CHROMEDRIVER_PATH:
+        return ScraperConfig.CHROMEDRIVER_PATH
+    return ChromeDriverManager().install()
+
+
 class EmailFinder:
     """
     Class untuk mencari dan mengekstrak email dari website bisnis.
     
+    Website di-fetch via HTTP (requests) secara paralel di thread pool;
+    browser hanya dipakai sebagai fallback untuk halaman JS-heavy (SPA)
+    yang HTML awalnya hampir kosong.
+    
     Menggunakan 3 metode extraction:
     1. Mencari mailto: links (paling akurat)
     2. Regex pattern matching di page source
-    3. Scanning visible elements (footer, contact section)
+    3. Scanning visible elements (footer, contact section) - browser only
     
     Attributes:
         driver: Selenium WebDriver instance
         original_timeout: Original page load timeout untuk restore nanti
+        executor: Thread pool untuk HTTP fetch paralel
+        email_window: Handle tab khusus fallback browser (None jika belum dibuat)
+    
+    Hasil lookup di-cache per URL website (ternormalisasi): cabang/franchise
+    dengan website yang sama hanya di-scan sekali.
     """
     
     def __init__(self, driver: webdriver.Chrome):
@@ -156,16 +263,336 @@ class EmailFinder:
         """
         self.driver = driver
         self.original_timeout = driver.timeouts.page_load
+        self.executor = ThreadPoolExecutor(
+            max_workers=ScraperConfig.EMAIL_CONCURRENCY,
+            thread_name_prefix="email-finder"
+        )
+        # requests.Session tidak thread-safe → satu session per worker thread
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        # Tab fallback dibuat saat pertama dibutuhkan lalu dipakai ulang
+        self.email_window: Optional[str] = None
+        # Hasil final per website (termasuk "" untuk website tanpa email)
+        # dan HTTP scan yang masih berjalan; keduanya hanya diakses dari
+        # thread pemilik WebDriver
+        self._email_cache: Dict[str, str] = {}
+        self._pending_lookups: Dict[str, Future] = {}
+    
+    def submit_lookup(self, website_url: str) -> Future:
+        """
+        Mulai HTTP scan website di thread pool tanpa menunggu hasilnya.
+        
+        Args:
+            website_url: URL website yang akan di-scan
+        
+        Returns:
+            Future berisi (email, conclusive), selesaikan via resolve_lookup()
+        
+        Note:
+            Website yang sudah di-cache atau sedang di-scan tidak di-submit
+            ulang; future yang sama (atau hasil cache) dikembalikan.
+        """
+        key = self._cache_key(website_url)
+        if key in self._email_cache:
+            future: Future = Future()
+            future.set_result((self._email_cache[key], True))
+            return future
+        
+        future = self._pending_lookups.get(key)
+        if future is None:
+            future = self.executor.submit(self._scan_with_requests, website_url)
+            self._pending_lookups[key] = future
+        return future
+    
+    def resolve_lookup(self, website_url: str, future: Future) -> str:
+        """
+        Tunggu hasil submit_lookup(), fallback ke browser jika tidak conclusive.
+        
+        Harus dipanggil dari thread pemilik WebDriver (fallback memakai driver).
+        
+        Args:
+            website_url: URL website yang di-submit
+            future: Future dari submit_lookup()
+        
+        Returns:
+            Email address jika ditemukan, empty string jika tidak
+        """
+        key = self._cache_key(website_url)
+        if key in self._email_cache:
+            # Website yang sama sudah di-resolve (termasuk fallback browser)
+            return self._email_cache[key]
+        
+        try:
+            email, conclusive = future.result()
+        except Exception as e:
+            logger.debug("   Email lookup error: %s", e)
+            email, conclusive = "", True
+        finally:
+            self._pending_lookups.pop(key, None)
+        
+        if not conclusive:
+            email = self._find_with_browser(website_url)
+        
+        self._email_cache[key] = email
+        return email
+    
+    @staticmethod
+    def _cache_key(website_url: str) -> str:
+        """
+        Key cache untuk website: host lowercase tanpa prefix "www.", plus
+        path tanpa trailing "/" dan query (scheme dan fragment diabaikan).
+        
+        Path ikut di key karena banyak bisnis memakai halaman di host
+        bersama sebagai website (instagram.com/bisnisA, linktr.ee/bisnisB);
+        key per host akan membagi email bisnis pertama ke semua bisnis lain.
+        
+        Args:
+            website_url: URL website
+        
+        Returns:
+            URL ternormalisasi, atau URL asli jika netloc tidak bisa di-parse
+        """
+        parsed = urlparse(website_url)
+        host = parsed.netloc.lower().removeprefix("www.")
+        if not host:
+            return website_url
+        
+        key = host + parsed.path.rstrip("/")
+        return f"{key}?{parsed.query}" if parsed.query else key
+    
+    def close(self) -> None:
+        """Shutdown thread pool dan tutup semua HTTP sessions."""
+        self.executor.shutdown(wait=True)
+        for session in self._sessions:
+            session.close()
+        self._sessions.clear()
+        self._pending_lookups.clear()
+        self._email_cache.clear()
+    
+    def close_email_tab(self) -> None:
+        """
+        Tutup tab fallback browser jika ada, lalu kembali ke tab sebelumnya.
+        
+        Note:
+            Aman dipanggil berkali-kali; tab dibuat ulang saat dibutuhkan.
+        """
+        if not self.email_window:
+            return
+        
+        email_window, self.email_window = self.email_window, None
+        try:
+            original_window = self.driver.current_window_handle
+            if original_window == email_window:
+                original_window = None
+            self.driver.switch_to.window(email_window)
+            self.driver.close()
+            if original_window:
+                self.driver.switch_to.window(original_window)
+            elif self.driver.window_handles:
+                self.driver.switch_to.window(self.driver.window_handles[0])
+        except WebDriverException as e:
+            logger.debug("   ⚠️  Gagal menutup email tab: %.100s", e)
+    
+    def _get_email_window(self) -> str:
+        """
+        Ambil handle tab fallback browser, buat sekali jika belum ada.
+        
+        URL blocking di-set saat tab masih kosong sehingga berlaku sejak
+        request pertama website dan tidak perlu diulang per website.
+        Caller harus kembali ke tab asal sendiri.
+        
+        Returns:
+            Window handle email tab (driver sudah switch ke tab ini)
+        """
+        if self.email_window:
+            self.driver.switch_to.window(self.email_window)
+            return self.email_window
+        
+        known_handles = set(self.driver.window_handles)
+        self.driver.execute_script("window.open('about:blank');")
+        new_handles = [h for h in self.driver.window_handles if h not in known_handles]
+        self.email_window = new_handles[0] if new_handles else self.driver.window_handles[-1]
+        self.driver.switch_to.window(self.email_window)
+        block_urls(self.driver, ScraperConfig.BLOCKED_URLS_EMAIL)
+        return self.email_window
+    
+    def _get_session(self) -> requests.Session:
+        """
+        Ambil requests.Session milik thread saat ini (dibuat sekali per thread).
+        
+        Returns:
+            requests.Session dengan User-Agent browser
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['User-Agent'] = ScraperConfig.USER_AGENT
+            
+            # Connection pool per host + tanpa retry internal urllib3 (fail fast)
+            adapter = HTTPAdapter(
+                pool_connections=ScraperConfig.EMAIL_HTTP_POOL_SIZE,
+                pool_maxsize=ScraperConfig.EMAIL_HTTP_POOL_SIZE,
+                max_retries=0
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            
+            self._local.session = session
+            self._sessions.append(session)
+        return session
+    
+    def _open_with_requests(self, url: str) -> Optional[requests.Response]:
+        """
+        Buka response HTTP website (streaming) tanpa browser.
+        
+        Header Content-Type dicek dulu, body non-HTML (PDF, image, dll)
+        tidak pernah di-download.
+        
+        Args:
+            url: URL website
+        
+        Returns:
+            Response yang belum dibaca body-nya (caller wajib close), atau
+            None jika response bukan HTML
+        
+        Raises:
+            requests.RequestException: Jika fetch gagal (timeout, HTTP error, dll)
+        """
+        response = self._get_session().get(
+            url,
+            timeout=ScraperConfig.EMAIL_HTTP_TIMEOUT,
+            allow_redirects=True,
+            stream=True
+        )
+        
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            response.close()
+            raise
+        
+        content_type = response.headers.get('Content-Type', '')
+        if 'html' not in content_type.lower():
+            response.close()
+            return None
+        
+        return response
+    
+    @staticmethod
+    def _iter_html_segments(response: requests.Response) -> Iterator[str]:
+        """
+        Decode body response per chunk menjadi segmen text yang aman di-scan.
+        
+        Setiap segmen dipotong setelah '<' atau '>' terakhir di chunk. Email dan
+        link mailto tidak pernah mengandung karakter tersebut, jadi tidak ada
+        alamat yang terbelah di antara dua segmen (sisa chunk ikut segmen
+        berikutnya). Chunk tanpa tag dipotong setelah whitespace/quote/koma
+        terakhir. Setiap karakter body di-yield tepat satu kali.
+        
+        Args:
+            response: Response HTML dari _open_with_requests()
+        
+        Yields:
+            Segmen HTML secara berurutan
+        """
+        # Tanpa charset dari header, iter_content akan yield bytes
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+        
+        carry = ""
+        for chunk in response.iter_content(
+            chunk_size=ScraperConfig.EMAIL_SCAN_CHUNK_SIZE,
+            decode_unicode=True
+        ):
+            text = carry + chunk
+            cut = max(text.rfind('<'), text.rfind('>')) + 1
+            if cut:
+                yield text[:cut]
+                carry = text[cut:]
+            else:
+                # Chunk tanpa tag sama sekali (jarang): potong di delimiter
+                # terakhir, tapi sisa yang ditahan maksimal sepanjang satu
+                # alamat email (run tanpa delimiter tidak menumpuk di carry)
+                match = const.EMAIL_SEGMENT_CUT_RE.match(text)
+                cut = max(
+                    match.end() if match else 0,
+                    len(text) - ScraperConfig.EMAIL_MAX_LENGTH
+                )
+                if cut:
+                    yield text[:cut]
+                carry = text[cut:]
+        
+        if carry:
+            yield carry
+    
+    def _scan_with_requests(self, url: str) -> Tuple[str, bool]:
+        """
+        Cari email di raw HTML hasil HTTP fetch (mailto dulu, lalu regex).
+        
+        Body di-scan per segmen selama di-download, jadi memory tetap kecil.
+        Scan berhenti lebih awal hanya di mailto valid; match regex dan
+        obfuscated pertama disimpan dan baru dipakai jika sampai akhir halaman
+        tidak ada mailto. Prioritas sama dengan _find_in_html() pada seluruh
+        halaman: alamat vendor di <script> awal tidak mengalahkan mailto
+        pemilik di footer.
+        
+        Args:
+            url: URL website
+        
+        Returns:
+            Tuple (email, conclusive). conclusive False berarti fetch gagal
+            atau HTML terlalu minim (kemungkinan JS SPA) dan perlu di-scan
+            ulang via browser.
+        """
+        try:
+            response = self._open_with_requests(url)
+        except requests.RequestException as e:
+            logger.debug("   ⚠️  HTTP fetch gagal %s: %.100s", url, e)
+            return "", False
+        
+        # Bukan HTML: browser juga tidak akan menemukan email di sini
+        if response is None:
+            logger.debug("   ⏭️  Bukan HTML, skip: %s", url)
+            return "", True
+        
+        html_length = 0
+        regex_email = obfuscated_email = ""
+        with response:
+            try:
+                for segment in self._iter_html_segments(response):
+                    html_length += len(segment)
+                    
+                    email = self._find_mailto(segment, "HTTP")
+                    if email:
+                        return email, True
+                    
+                    if not regex_email:
+                        regex_email = extract_email_from_text(segment)
+                        if not regex_email and not obfuscated_email:
+                            obfuscated_email = extract_obfuscated_email(segment)
+            except requests.RequestException as e:
+                logger.debug("   ⚠️  HTTP read gagal %s: %.100s", url, e)
+                return "", False
+        
+        if regex_email:
+            logger.debug("   ✅ Email found via regex (HTTP): %s", regex_email)
+            return regex_email, True
+        
+        if obfuscated_email:
+            logger.debug("   ✅ Email found via obfuscated text (HTTP): %s", obfuscated_email)
+            return obfuscated_email, True
+        
+        return "", html_length >= ScraperConfig.EMAIL_MIN_HTML_LENGTH
     
-    def find_email_on_website(self, website_url: str) -> str:
+    def _find_with_browser(self, website_url: str) -> str:
         """
-        Mencari email di website menggunakan multiple methods.
+        Mencari email di website via browser (fallback untuk JS-heavy pages).
         
         Process:
-        1. Buka website di tab baru (untuk isolation)
+        1. Buka website di email tab (dibuat sekali, dipakai ulang)
         2. Set timeout pendek (anti-stuck)
         3. Try 3 extraction methods secara berurutan
-        4. Cleanup dan close tab
+        4. Restore timeout dan kembali ke tab asal
         
         Args:
             website_url: URL website yang akan di-scan
@@ -183,11 +610,10 @@ class EmailFinder:
             # Set timeout pendek untuk anti-stuck
             self.driver.set_page_load_timeout(ScraperConfig.EMAIL_PAGE_LOAD_TIMEOUT)
             
-            # Buka di tab baru untuk isolation
-            self.driver.execute_script("window.open('');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
+            # Satu tab untuk semua website: tanpa open/close tab per website
+            self._get_email_window()
             
-            logger.debug(f"   → Scanning website: {website_url}")
+            logger.debug("   → Scanning website: %s", website_url)
             self.driver.get(website_url)
             
             # Wait for body element
@@ -195,119 +621,114 @@ class EmailFinder:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # Method 1: Mailto links (paling akurat)
-            email = self._find_by_mailto()
+            # Method 1 + 2: mailto links lalu regex, dari satu snapshot HTML
+            email = self._find_in_html(self.driver.page_source, "browser")
             
-            # Method 2: Regex di page source
+            # Method 3: Rendered text (alamat yang di HTML terpotong tag)
             if not email:
-                email = self._find_by_regex()
-            
-            # Method 3: Visible text elements
-            if not email:
-                email = self._find_in_visible_elements()
+                email = self._find_in_visible_text()
             
         except TimeoutException:
-            logger.debug(f"   ⏱️  Timeout saat load website: {website_url}")
+            logger.debug("   ⏱️  Timeout saat load website: %s", website_url)
+            
+        except NoSuchWindowException as e:
+            # Email tab tertutup dari luar → buat ulang di lookup berikutnya
+            self.email_window = None
+            logger.debug("   ⚠️  Email tab hilang: %.100s", e)
             
         except WebDriverException as e:
-            logger.debug(f"   ⚠️  WebDriver error: {str(e)[:100]}")
+            logger.debug("   ⚠️  WebDriver error: %.100s", e)
             
         except Exception as e:
-            logger.debug(f"   ❌ Error scanning website: {str(e)[:100]}")
+            logger.debug("   ❌ Error scanning website: %.100s", e)
             
         finally:
-            # Cleanup: restore timeout & close tab
-            self.driver.set_page_load_timeout(self.original_timeout)
+            # Cleanup: restore timeout & kembali ke tab asal (email tab tetap)
             try:
-                self.driver.close()
+                self.driver.set_page_load_timeout(self.original_timeout)
                 self.driver.switch_to.window(original_window)
             except Exception:
-                # Fallback jika tab sudah tertutup
+                # Fallback jika tab asal sudah tertutup
                 if len(self.driver.window_handles) > 0:
                     self.driver.switch_to.window(self.driver.window_handles[0])
         
         return email
     
-    def _find_by_mailto(self) -> str:
+    @staticmethod
+    def _find_in_html(html: str, source: str) -> str:
         """
-        Method 1: Cari email via mailto: links.
-        Paling akurat karena explicit email link.
+        Method 1 + 2: Cari email di raw HTML, mailto: links dulu lalu regex.
+        
+        Mailto paling akurat (explicit email link), regex untuk alamat yang
+        hanya ditulis sebagai text (termasuk bentuk "info [at] domain [dot] com").
+        Dipakai oleh HTTP scan dan fallback browser sehingga keduanya punya
+        aturan yang sama.
+        
+        Args:
+            html: HTML (atau segmen HTML) yang akan di-scan
+            source: Label asal HTML untuk debug log ("HTTP" / "browser")
         
         Returns:
             Email address atau empty string
         """
-        try:
-            mailto_links = self.driver.find_elements(
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_MAILTO]
-            )
-            
-            if mailto_links:
-                href = mailto_links[0].get_attribute('href')
-                # Parse mailto:email@domain.com?subject=...
-                email = href.replace('mailto:', '').split('?')[0].strip()
-                
-                if validate_email(email):
-                    logger.debug(f"   ✅ Email found via mailto: {email}")
-                    return email
-                    
-        except Exception as e:
-            logger.debug(f"   Mailto method error: {e}")
+        email = EmailFinder._find_mailto(html, source)
+        if email:
+            return email
+        
+        email = extract_email_from_text(html)
+        if email:
+            logger.debug("   ✅ Email found via regex (%s): %s", source, email)
+            return email
+        
+        email = extract_obfuscated_email(html)
+        if email:
+            logger.debug("   ✅ Email found via obfuscated text (%s): %s", source, email)
+            return email
         
         return ""
     
-    def _find_by_regex(self) -> str:
+    @staticmethod
+    def _find_mailto(html: str, source: str) -> str:
         """
-        Method 2: Cari email dengan regex pattern di page source.
+        Method 1: Cari email valid pertama dari mailto: links di raw HTML.
+        
+        Args:
+            html: HTML (atau segmen HTML) yang akan di-scan
+            source: Label asal HTML untuk debug log ("HTTP" / "browser")
         
         Returns:
             Email address atau empty string
         """
-        try:
-            page_source = self.driver.page_source.lower()
-            email = extract_email_from_text(page_source)
-            
-            if email:
-                logger.debug(f"   ✅ Email found via regex: {email}")
+        for match in const.MAILTO_RE.finditer(html):
+            # href di raw HTML bisa berisi entity (&#64;) dan percent-encoding
+            email = unquote(unescape(match.group(1))).strip()
+            if validate_email(email):
+                logger.debug("   ✅ Email found via mailto (%s): %s", source, email)
                 return email
-                
-        except Exception as e:
-            logger.debug(f"   Regex method error: {e}")
         
         return ""
     
-    def _find_in_visible_elements(self) -> str:
+    def _find_in_visible_text(self) -> str:
         """
-        Method 3: Cari email di visible text elements.
-        Fokus ke footer, contact section, dll.
+        Method 3: Cari email di rendered text halaman (document.body.innerText).
+        
+        Menemukan alamat yang di raw HTML terpotong tag, contoh
+        "info<span>@</span>domain.com". Satu execute_script untuk seluruh
+        halaman, jadi tidak ada query + .text per element.
         
         Returns:
             Email address atau empty string
         """
         try:
-            # Common selectors untuk email
-            selectors = [
-                "//footer",
-                "//*[contains(@class, 'contact')]",
-                "//*[contains(@class, 'footer')]",
-                "//*[contains(@id, 'contact')]",
-                "//*[contains(@id, 'footer')]"
-            ]
-            
-            for selector in selectors:
-                elements = self.driver.find_elements(By.XPATH, selector)
+            text = self.driver.execute_script(const.JS_BODY_TEXT) or ""
+            email = extract_email_from_text(text) or extract_obfuscated_email(text)
+            
+            if email:
+                logger.debug("   ✅ Email found in visible text: %s", email)
+                return email
                 
-                # Limit to first 3 matches untuk efficiency
-                for element in elements[:3]:
-                    text = element.text.lower()
-                    email = extract_email_from_text(text)
-                    
-                    if email:
-                        logger.debug(f"   ✅ Email found in visible element: {email}")
-                        return email
-                        
         except Exception as e:
-            logger.debug(f"   Visible elements method error: {e}")
+            logger.debug("   Visible text method error: %s", e)
         
         return ""
 
@@ -329,37 +750,60 @@ class GoogleMapsScraper:
         wait: WebDriverWait instance
         email_finder: EmailFinder instance
         headless: Flag untuk headless mode
+        workers: Jumlah worker process untuk detail pages
     """
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, workers: int = ScraperConfig.WORKER_COUNT):
         """
         Initialize scraper.
         
         Args:
             headless: Jika True, run browser dalam headless mode
+            workers: Jumlah worker process (browser) untuk detail pages,
+                1 = semua di browser utama
+        
+        Note:
+            Config divalidasi di sini (bukan saat import config.py), jadi
+            override dari CLI seperti VALIDATION_MODE ikut tervalidasi.
         """
+        ScraperConfig.validate_config()
+        
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
         self.email_finder: Optional[EmailFinder] = None
         self.headless = headless
+        self.workers = max(1, workers)
     
     def setup_driver(self) -> None:
         """
         Setup Selenium WebDriver dengan configuration optimal.
         
+        Idempotent: jika browser dari run sebelumnya masih hidup, dipakai ulang
+        tanpa start Chrome (dan ChromeDriverManager) lagi.
+        
         Raises:
             WebDriverSetupError: Jika gagal setup WebDriver
         """
+        if self.is_driver_alive():
+            logger.info("♻️  Memakai ulang browser yang sudah berjalan")
+            return
+        
         logger.info("🔧 Setup Selenium WebDriver...")
         
         try:
-            service = Service(ChromeDriverManager().install())
+            # --silent: chromedriver tidak menulis log per command (output ke DEVNULL)
+            service = Service(_get_driver_path(), service_args=['--silent'])
             options = ScraperConfig.get_chrome_options(headless=self.headless)
             
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # keep_alive: satu HTTP connection ke chromedriver dipakai ulang untuk
+            # semua command (command per driver selalu serial, 1 connection cukup)
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             self.driver.set_page_load_timeout(ScraperConfig.PAGE_LOAD_TIMEOUT)
             self.driver.implicitly_wait(ScraperConfig.IMPLICIT_WAIT)
             
+            # Font/media di Maps tidak pernah dipakai (CSS tetap untuk layout feed)
+            block_urls(self.driver, ScraperConfig.BLOCKED_URLS_MAPS)
+            
             self.wait = WebDriverWait(self.driver, ScraperConfig.EXPLICIT_WAIT)
             self.email_finder = EmailFinder(self.driver)
             
@@ -370,7 +814,32 @@ class GoogleMapsScraper:
             logger.error(error_msg)
             raise WebDriverSetupError(details=str(e))
     
-    @retry_on_failure(max_retries=2, delay=3)
+    def is_driver_alive(self) -> bool:
+        """
+        Cek apakah WebDriver sudah di-setup, chromedriver masih bisa dihubungi,
+        dan session browser masih merespons.
+        
+        Returns:
+            True jika driver bisa dipakai ulang
+        """
+        if self.driver is None:
+            return False
+        
+        try:
+            if not self.driver.service.is_connectable():
+                return False
+            # chromedriver bisa tetap hidup walau Chrome crash: cek session juga
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+    
+    @retry_on_failure(
+        max_retries=2,
+        delay=3,
+        retry_on=(TimeoutException, WebDriverException),
+        no_retry_on=(NoSuchElementException,)
+    )
     def search_google_maps(self, query: str) -> None:
         """
         Buka Google Maps dan lakukan pencarian.
@@ -389,22 +858,35 @@ class GoogleMapsScraper:
             # Find search box dan input query
             search_box = self.wait.until(
                 EC.element_to_be_clickable(
-                    ScraperConfig.SELECTORS[const.SELECTOR_ID_SEARCH_BOX]
+                    ScraperConfig.get_locator(const.SELECTOR_ID_SEARCH_BOX)
                 )
             )
             search_box.clear()
-            search_box.send_keys(query)
+            search_box.click()
+            
+            # Satu CDP command untuk seluruh query (send_keys = satu event per karakter)
+            try:
+                self.driver.execute_cdp_cmd('Input.insertText', {'text': query})
+            except (AttributeError, WebDriverException) as e:
+                logger.debug("Input.insertText tidak tersedia, fallback send_keys: %s", e)
+                search_box.send_keys(query)
             search_box.send_keys(Keys.ENTER)
             
-            # Wait for results to load
-            time.sleep(ScraperConfig.AFTER_SEARCH_DELAY)
+            # Wait for results to load: hasil list, atau langsung halaman detail
+            # jika query hanya punya satu hasil
+            wait_for_selector(
+                self.driver,
+                const.SELECTOR_ID_RESULT_LINKS,
+                const.SELECTOR_ID_NAME,
+                timeout=ScraperConfig.AFTER_SEARCH_DELAY
+            )
             
             logger.info(f"✅ {const.SUCCESS_SEARCH}")
             
         except Exception as e:
             error_msg = f"Search failed for query '{query}': {e}"
             logger.error(error_msg)
-            raise SearchError(query=query, details=str(e))
+            raise SearchError(query=query, details=str(e)) from e
     
     def collect_links(self, max_scrolls: int) -> List[str]:
         """
@@ -431,7 +913,7 @@ class GoogleMapsScraper:
             # Find scrollable div
             scrollable_div = self.wait.until(
                 EC.presence_of_element_located(
-                    (By.XPATH, ScraperConfig.SELECTORS[const.SELECTOR_ID_FEED])
+                    ScraperConfig.get_locator(const.SELECTOR_ID_FEED)
                 )
             )
             
@@ -451,20 +933,15 @@ class GoogleMapsScraper:
             
             # Collect links
             logger.info(f"🔗 {const.INFO_COLLECTING_LINKS}")
-            result_links = self.driver.find_elements(
-                By.CSS_SELECTOR,
+            # Semua href diambil dalam satu execute_script, bukan satu
+            # get_attribute round-trip per element
+            hrefs = self.driver.execute_script(
+                const.JS_COLLECT_HREFS,
                 ScraperConfig.SELECTORS[const.SELECTOR_ID_RESULT_LINKS]
-            )
-            
-            # Extract URLs
-            links = [
-                link.get_attribute('href')
-                for link in result_links
-                if link.get_attribute('href')
-            ]
+            ) or []
             
             # Deduplicate sambil preserve order
-            unique_links = list(dict.fromkeys(links))
+            unique_links = list(dict.fromkeys(hrefs))
             
             if not unique_links:
                 raise NoResultsFoundError()
@@ -478,28 +955,98 @@ class GoogleMapsScraper:
             logger.error(f"Error collecting links: {e}")
             raise
     
-    def scrape_detail_page(self, url: str) -> Dict[str, str]:
+    def scrape_detail_pages(self, urls: List[str]) -> List[Dict[str, str]]:
+        """
+        Scrape beberapa halaman bisnis sekaligus, satu tab per URL.
+        
+        Process:
+        1. Buka semua URL di tab baru via window.open (tidak blocking)
+        2. Per tab: tunggu nama bisnis muncul (maks DETAIL_PAGE_DELAY)
+        3. Extract field di browser, close tab
+        
+        Network + render wait antar halaman jadi overlap, bukan berurutan.
+        Email tidak dicari di sini (diisi batch oleh caller).
+        
+        Args:
+            urls: List URL halaman detail bisnis
+        
+        Returns:
+            List data per URL, urutan sama dengan urls
         """
-        Scrape detail dari satu halaman bisnis.
+        main_window = self.driver.current_window_handle
+        tabs: List[Tuple[str, Optional[str]]] = []
+        
+        # Mulai semua navigasi tanpa menunggu page load
+        for url in urls:
+            known_handles = set(self.driver.window_handles)
+            try:
+                self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+                new_handles = [h for h in self.driver.window_handles if h not in known_handles]
+                tabs.append((url, new_handles[0] if new_handles else None))
+            except WebDriverException as e:
+                logger.warning(f"⚠️  Gagal membuka tab untuk {url}: {str(e)[:100]}")
+                tabs.append((url, None))
         
-        Data yang di-extract:
-        - Nama bisnis
-        - Alamat lengkap
-        - Kota (extracted dari alamat)
-        - Nomor telepon
-        - Deskripsi/kategori
-        - Website URL
-        - Logo/image URL
-        - Email (dari website jika ada)
-        - Google Maps URL
+        rows = []
+        for url, handle in tabs:
+            data = self._empty_row(url)
+            
+            if handle is None:
+                rows.append(data)
+                continue
+            
+            # Close hanya setelah switch berhasil: jika tab sudah crash/tertutup,
+            # window aktif bisa main_window (halaman hasil search)
+            try:
+                self.driver.switch_to.window(handle)
+            except WebDriverException as e:
+                logger.warning(f"⚠️  Tab untuk {url} sudah tertutup: {str(e)[:100]}")
+                rows.append(data)
+                continue
+            
+            try:
+                WebDriverWait(self.driver, ScraperConfig.PAGE_LOAD_TIMEOUT).until(
+                    lambda driver: driver.execute_script("return document.readyState") != "loading"
+                )
+                # Tab lain tetap load di background selama tab ini ditunggu
+                wait_for_selector(
+                    self.driver,
+                    const.SELECTOR_ID_NAME,
+                    timeout=ScraperConfig.DETAIL_PAGE_DELAY
+                )
+                data = self._build_detail_row(url, fetch_detail_fields(self.driver))
+                
+            except TimeoutException:
+                logger.warning(
+                    f"⏱️  Timeout ({ScraperConfig.PAGE_LOAD_TIMEOUT}s) saat load {url}, skip"
+                )
+                
+            except Exception as e:
+                logger.warning(f"⚠️  Error scraping {url}: {str(e)[:100]}")
+                
+            finally:
+                try:
+                    self.driver.close()
+                except WebDriverException:
+                    pass  # Tab sudah tertutup
+            
+            rows.append(data)
+        
+        self.driver.switch_to.window(main_window)
+        return rows
+    
+    @staticmethod
+    def _empty_row(url: str) -> Dict[str, str]:
+        """
+        Row kosong untuk satu listing (hanya Google Maps URL terisi).
         
         Args:
             url: URL halaman detail bisnis
         
         Returns:
-            Dictionary berisi data yang di-scrape
+            Dictionary dengan semua CSV header
         """
-        data = {
+        return {
             const.CSV_HEADER_NAMA: '',
             const.CSV_HEADER_ALAMAT: '',
             const.CSV_HEADER_KOTA: '',
@@ -510,87 +1057,224 @@ class GoogleMapsScraper:
             const.CSV_HEADER_EMAIL: '',
             const.CSV_HEADER_MAP_URL: url
         }
+    
+    def _build_detail_row(self, url: str, fields: Dict[str, str]) -> Dict[str, str]:
+        """
+        Bangun row data dari raw field halaman detail (tanpa email).
         
-        try:
-            self.driver.get(url)
-            time.sleep(ScraperConfig.DETAIL_PAGE_DELAY)
-            
-            # Nama bisnis
-            data[const.CSV_HEADER_NAMA] = safe_find_element(
-                self.driver,
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_NAME]
-            )
-            
-            # Alamat
-            address_raw = safe_find_element(
-                self.driver,
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_ADDRESS],
-                attribute='aria-label'
+        Args:
+            url: URL halaman detail bisnis
+            fields: Raw field dari fetch_detail_fields()
+        
+        Returns:
+            Dictionary berisi data yang di-scrape
+        """
+        data = self._empty_row(url)
+        
+        # Nama bisnis
+        data[const.CSV_HEADER_NAMA] = fields[const.CSV_HEADER_NAMA]
+        
+        # Alamat
+        address_raw = fields[const.CSV_HEADER_ALAMAT]
+        if address_raw and ':' in address_raw:
+            data[const.CSV_HEADER_ALAMAT] = address_raw.split(':', 1)[1].strip()
+        
+        # Kota (extract dari alamat)
+        if data[const.CSV_HEADER_ALAMAT]:
+            data[const.CSV_HEADER_KOTA] = extract_city_from_address(
+                data[const.CSV_HEADER_ALAMAT]
             )
-            if address_raw and ':' in address_raw:
-                data[const.CSV_HEADER_ALAMAT] = address_raw.split(':', 1)[1].strip()
-            
-            # Kota (extract dari alamat)
-            if data[const.CSV_HEADER_ALAMAT]:
-                data[const.CSV_HEADER_KOTA] = extract_city_from_address(
-                    data[const.CSV_HEADER_ALAMAT]
-                )
-            
-            # Telepon
-            phone_raw = safe_find_element(
-                self.driver,
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_PHONE],
-                attribute='aria-label'
+        
+        # Telepon
+        phone_raw = fields[const.CSV_HEADER_TELEPON]
+        if phone_raw and ':' in phone_raw:
+            data[const.CSV_HEADER_TELEPON] = format_phone_number(
+                phone_raw.split(':', 1)[1]
             )
-            if phone_raw and ':' in phone_raw:
-                data[const.CSV_HEADER_TELEPON] = format_phone_number(
-                    phone_raw.split(':', 1)[1]
+        
+        # Deskripsi/Kategori
+        data[const.CSV_HEADER_DESKRIPSI] = fields[const.CSV_HEADER_DESKRIPSI]
+        
+        # Website URL
+        data[const.CSV_HEADER_WEBSITE] = fields[const.CSV_HEADER_WEBSITE]
+        
+        # Logo/Image
+        data[const.CSV_HEADER_LOGO] = fields[const.CSV_HEADER_LOGO]
+        
+        return data
+    
+    def _iter_scraped_rows(self, links: List[str]) -> Iterator[Dict[str, str]]:
+        """
+        Scrape detail pages per DETAIL_CONCURRENCY tab, email dicari secara pipeline.
+        
+        Email lookup setiap row di-submit ke thread pool EmailFinder begitu
+        row selesai di-scrape, lalu detail page berikutnya langsung di-load.
+        Row di-yield (urut) setelah lookup-nya selesai, jadi network wait email
+        overlap dengan scraping detail page, bukan bergantian.
+        
+        Args:
+            links: List of URLs untuk di-scrape
+        
+        Yields:
+            Dictionary data per link (urutan sama dengan links), email terisi
+        """
+        pending: Deque[Tuple[Dict[str, str], Optional[Future]]] = deque()
+        
+        def resolve(row: Dict[str, str], future: Optional[Future]) -> Dict[str, str]:
+            if future is not None:
+                row[const.CSV_HEADER_EMAIL] = self.email_finder.resolve_lookup(
+                    row[const.CSV_HEADER_WEBSITE], future
                 )
+            return row
+        
+        # Detail pages di-load paralel per tab (dan per worker process)
+        for rows in self._iter_detail_batches(links):
+            for row in rows:
+                website = row[const.CSV_HEADER_WEBSITE]
+                future = None
+                if website and self.email_finder:
+                    # Website yang sama (cabang bisnis) di-dedupe oleh EmailFinder
+                    future = self.email_finder.submit_lookup(website)
+                pending.append((row, future))
             
-            # Deskripsi/Kategori
-            data[const.CSV_HEADER_DESKRIPSI] = safe_find_element(
-                self.driver,
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_CATEGORY]
-            )
-            
-            # Website URL
-            data[const.CSV_HEADER_WEBSITE] = safe_find_element(
-                self.driver,
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_WEBSITE],
-                attribute='href'
-            )
+            # Yield row terdepan yang lookup-nya sudah selesai, tanpa blocking
+            while pending and (pending[0][1] is None or pending[0][1].done()):
+                yield resolve(*pending.popleft())
             
-            # Logo/Image
-            data[const.CSV_HEADER_LOGO] = safe_find_element(
-                self.driver,
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_LOGO],
-                attribute='src'
-            )
+            # Batasi backlog agar row tidak tertahan terlalu lama di memory
+            while len(pending) > ScraperConfig.EMAIL_MAX_PENDING:
+                yield resolve(*pending.popleft())
+        
+        # Sisa pending (juga saat shutdown, agar data yang sudah di-scrape tersimpan)
+        while pending:
+            yield resolve(*pending.popleft())
+    
+    def _iter_detail_batches(self, links: List[str]) -> Iterator[List[Dict[str, str]]]:
+        """
+        Scrape links per chunk DETAIL_CONCURRENCY, di process ini atau di worker pool.
+        
+        Args:
+            links: List of URLs untuk di-scrape
+        
+        Yields:
+            List data per chunk (urutan sama dengan links)
+        """
+        step = ScraperConfig.DETAIL_CONCURRENCY
+        chunks = [links[start:start + step] for start in range(0, len(links), step)]
+        workers = min(self.workers, len(chunks))
+        
+        if workers > 1:
+            yield from self._iter_detail_batches_parallel(chunks, workers)
+            return
+        
+        for chunk in chunks:
+            # Check shutdown request
+            if shutdown_requested:
+                logger.warning("⚠️  Shutdown detected. Menyimpan progress...")
+                return
             
-            # Email (hanya jika ada website)
-            if data[const.CSV_HEADER_WEBSITE] and self.email_finder:
+            yield self.scrape_detail_pages(chunk)
+    
+    def _iter_detail_batches_parallel(
+        self,
+        chunks: List[List[str]],
+        workers: int
+    ) -> Iterator[List[Dict[str, str]]]:
+        """
+        Scrape chunks di pool worker process, masing-masing dengan WebDriver sendiri.
+        
+        Selenium tidak thread-safe, jadi paralelisme pakai process. Task
+        di-submit dengan window terbatas (2 per worker) sehingga saat shutdown
+        hanya chunk yang sedang jalan yang ditunggu (hasilnya tetap di-yield).
+        
+        Jika pool rusak (contoh Chrome gagal start di salah satu worker →
+        BrokenProcessPool), chunk yang belum selesai di-scrape di browser
+        process ini sehingga run tetap selesai.
+        
+        Args:
+            chunks: List chunk URL
+            workers: Jumlah worker process
+        
+        Yields:
+            List data per chunk (urutan sama dengan chunks)
+        """
+        logger.info(f"🧵 Menjalankan {workers} worker process (1 browser per worker)")
+        
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.headless,)
+        )
+        remaining = iter(chunks)
+        pending: Deque[Tuple[List[str], Future]] = deque(
+            (chunk, executor.submit(_worker_scrape, chunk))
+            for chunk in islice(remaining, workers * 2)
+        )
+        broken = False
+        
+        try:
+            while pending:
+                # Check shutdown request
+                if shutdown_requested:
+                    logger.warning("⚠️  Shutdown detected. Menyimpan progress...")
+                    break
+                
+                chunk, future = pending[0]
                 try:
-                    data[const.CSV_HEADER_EMAIL] = self.email_finder.find_email_on_website(
-                        data[const.CSV_HEADER_WEBSITE]
+                    rows = future.result()
+                except BrokenProcessPool as e:
+                    logger.error(
+                        f"❌ Worker pool gagal ({e}). "
+                        "Sisa chunk di-scrape di browser utama..."
                     )
+                    broken = True
+                    break
                 except Exception as e:
-                    logger.debug(f"   Email extraction error: {e}")
-            
-        except Exception as e:
-            logger.warning(f"⚠️  Error scraping {url}: {str(e)[:100]}")
+                    logger.warning(
+                        f"⚠️  Worker error: {str(e)[:100]}. Chunk di-scrape di browser utama..."
+                    )
+                    rows = self.scrape_detail_pages(chunk)
+                
+                pending.popleft()
+                next_chunk = next(remaining, None)
+                if next_chunk is not None:
+                    pending.append((next_chunk, executor.submit(_worker_scrape, next_chunk)))
+                
+                yield rows
+        finally:
+            # Worker keluar normal → Finalize di worker menutup browser-nya
+            executor.shutdown(wait=True, cancel_futures=True)
         
-        return data
+        def completed(future: Optional[Future]) -> bool:
+            # Setelah shutdown(wait=True) setiap future sudah selesai atau cancelled
+            return future is not None and not future.cancelled() and future.exception() is None
+        
+        if not broken:
+            # Shutdown: chunk yang sudah ditunggu sampai selesai tetap disimpan
+            for chunk, future in pending:
+                if completed(future):
+                    yield future.result()
+            return
+        
+        # Pool rusak: pakai hasil worker yang sempat selesai, scrape ulang
+        # sisanya di process ini
+        leftover = list(pending) + [(chunk, None) for chunk in remaining]
+        for chunk, future in leftover:
+            if shutdown_requested:
+                logger.warning("⚠️  Shutdown detected. Menyimpan progress...")
+                return
+            
+            if completed(future):
+                yield future.result()
+            else:
+                yield self.scrape_detail_pages(chunk)
     
     def scrape_all(
         self,
         links: List[str],
-        output_file: str
+        output_file: str,
+        force_flush_after: int = ScraperConfig.FLUSH_INTERVAL,
+        resume_file: Optional[str] = None
     ) -> Tuple[int, DataStatistics]:
         """
         Scrape semua links dan simpan ke CSV dengan validation.
@@ -598,7 +1282,7 @@ class GoogleMapsScraper:
         Process:
         1. Open CSV file untuk writing
         2. Iterate semua links
-        3. Scrape detail dari setiap link
+        3. Scrape detail dari setiap link (email dicari per batch paralel)
         4. Truncate long fields
         5. Validate data berdasarkan mode
         6. Save jika valid, skip jika tidak
@@ -607,6 +1291,12 @@ class GoogleMapsScraper:
         Args:
             links: List of URLs untuk di-scrape
             output_file: Path file output CSV
+            force_flush_after: Flush file setiap N rows tersimpan.
+                0 = andalkan buffering (default, paling cepat). Set > 0 jika
+                crash-safety lebih penting dari throughput.
+            resume_file: Path resume log (optional). Link yang tercatat di
+                sini di-skip; link yang selesai dicatat setiap CSV ter-flush.
+                File dihapus jika semua link selesai tanpa interrupt.
         
         Returns:
             Tuple (success_count: int, statistics: DataStatistics)
@@ -617,69 +1307,147 @@ class GoogleMapsScraper:
         # Show required fields
         required = ScraperConfig.VALIDATION_RULES[ScraperConfig.VALIDATION_MODE]
         if required:
-            logger.info(f"📋 Required Fields: {', '.join(required)}")
+            required_display = [h for h in ScraperConfig.CSV_HEADERS if h in required]
+            logger.info(f"📋 Required Fields: {', '.join(required_display)}")
         else:
             logger.info("📋 No validation - semua data akan disimpan")
         
+        # Skip link yang sudah selesai di run sebelumnya yang terputus
+        done_links = load_done_links(resume_file) if resume_file else set()
+        if done_links:
+            remaining = [link for link in links if link not in done_links]
+            logger.info(
+                f"♻️  Resume: {len(links) - len(remaining)} link sudah selesai "
+                f"di run sebelumnya, di-skip"
+            )
+            links = remaining
+        
         stats = DataStatistics()
         tracker = ProgressTracker(len(links), "Scraping Progress")
+        # Link selesai yang belum dicatat (menunggu CSV ter-flush)
+        completed: List[str] = []
+        finished = False
+        
+        try:
+            self._write_rows(
+                links,
+                output_file,
+                force_flush_after,
+                resume_file,
+                completed,
+                stats,
+                tracker
+            )
+            finished = not shutdown_requested
+        finally:
+            if resume_file and finished:
+                Path(resume_file).unlink(missing_ok=True)
+            elif resume_file:
+                # CSV sudah di-close (ter-flush) → aman dicatat selesai
+                append_done_links(resume_file, completed)
+                if Path(resume_file).exists():
+                    logger.info(
+                        f"♻️  Progress dicatat di {resume_file}, jalankan query "
+                        f"yang sama untuk melanjutkan"
+                    )
+        
+        tracker.complete("Processing selesai")
+        return stats.total_saved, stats
+    
+    def _write_rows(
+        self,
+        links: List[str],
+        output_file: str,
+        force_flush_after: int,
+        resume_file: Optional[str],
+        completed: List[str],
+        stats: DataStatistics,
+        tracker: ProgressTracker
+    ) -> None:
+        """
+        Scrape links lalu tulis row yang valid ke CSV (loop utama scrape_all).
         
-        with open(output_file, 'w', newline='', encoding=ScraperConfig.CSV_ENCODING) as f:
-            writer = csv.DictWriter(f, fieldnames=ScraperConfig.CSV_HEADERS)
-            writer.writeheader()
+        Args:
+            links: List of URLs untuk di-scrape
+            output_file: Path file output CSV
+            force_flush_after: Flush file setiap N rows tersimpan (0 = tidak)
+            resume_file: Path resume log (optional)
+            completed: Diisi URL yang selesai dan belum dicatat ke resume log
+            stats: Statistics yang di-update per row
+            tracker: Progress tracker
+        """
+        with open(
+            output_file,
+            'w',
+            newline='',
+            encoding=ScraperConfig.CSV_ENCODING,
+            buffering=ScraperConfig.CSV_BUFFER_SIZE
+        ) as f:
+            # csv.writer + itemgetter: kolom diambil urut dalam satu C call,
+            # tanpa DictWriter yang mengecek extra keys lalu lookup per field
+            writer = csv.writer(f)
+            writer.writerow(ScraperConfig.CSV_HEADERS)
+            row_values = itemgetter(*ScraperConfig.CSV_HEADERS)
             
-            for i, link in enumerate(links, 1):
-                # Check shutdown request
-                if shutdown_requested:
-                    logger.warning("⚠️  Shutdown detected. Menyimpan progress...")
-                    break
-                
-                # Scrape data
-                data = self.scrape_detail_page(link)
+            # Bind sekali di luar loop: local lookup, bukan module/class attribute per row
+            header_nama = const.CSV_HEADER_NAMA
+            header_email = const.CSV_HEADER_EMAIL
+            header_map_url = const.CSV_HEADER_MAP_URL
+            validator = make_validator(ScraperConfig.VALIDATION_MODE)
+            
+            for data in self._iter_scraped_rows(links):
+                # Row tanpa nama = detail page gagal load → dicoba lagi saat resume
+                if data[header_nama]:
+                    completed.append(data[header_map_url])
                 
                 # Truncate long fields
                 data = truncate_fields(data)
                 
                 # Validate data
-                is_valid, reason = validate_data(data, ScraperConfig.VALIDATION_MODE)
+                is_valid, reason = validator(data)
                 
                 if is_valid:
                     # Save to CSV
-                    writer.writerow(data)
+                    writer.writerow(row_values(data))
                     stats.add_saved()
                     
                     # Log progress
                     email_status = (
-                        f"✉️ {data[const.CSV_HEADER_EMAIL][:30]}"
-                        if data[const.CSV_HEADER_EMAIL]
+                        f"✉️ {data[header_email][:30]}"
+                        if data[header_email]
                         else "❌"
                     )
                     name_display = (
-                        data[const.CSV_HEADER_NAMA][:35]
-                        if data[const.CSV_HEADER_NAMA]
+                        data[header_nama][:35]
+                        if data[header_nama]
                         else "No name"
                     )
                     tracker.update(1, f"✅ {name_display} | {email_status}")
                     
-                    # Flush periodically untuk prevent data loss
-                    if stats.total_saved % ScraperConfig.FLUSH_INTERVAL == 0:
+                    # Opt-in flush untuk prevent data loss saat crash
+                    if force_flush_after and stats.total_saved % force_flush_after == 0:
                         f.flush()
+                        if resume_file:
+                            append_done_links(resume_file, completed)
+                            completed.clear()
                 else:
                     # Skip data
                     stats.add_skipped(reason)
                     
                     # Log skip
                     name_display = (
-                        data[const.CSV_HEADER_NAMA][:35]
-                        if data[const.CSV_HEADER_NAMA]
+                        data[header_nama][:35]
+                        if data[header_nama]
                         else "No name"
                     )
                     logger.warning(f"   ⏭️  SKIP: {name_display} - {reason}")
-        
-        tracker.complete("Processing selesai")
-        return stats.total_saved, stats
     
-    def run(self, query: str, max_scrolls: int) -> Tuple[str, int, DataStatistics]:
+    def run(
+        self,
+        query: str,
+        max_scrolls: int,
+        keep_browser: bool = False
+    ) -> Tuple[str, int, DataStatistics]:
         """
         Main method untuk menjalankan scraper end-to-end.
         
@@ -694,6 +1462,9 @@ class GoogleMapsScraper:
         Args:
             query: Search query
             max_scrolls: Maksimal scroll
+            keep_browser: Jika True, browser tidak ditutup setelah run sehingga
+                run berikutnya langsung memakai sesi yang sama. Panggil close()
+                setelah run terakhir.
         
         Returns:
             Tuple (output_filename: str, success_count: int, statistics: DataStatistics)
@@ -711,12 +1482,23 @@ class GoogleMapsScraper:
             
             # Generate output filename
             ScraperConfig.create_output_dir()
-            safe_query = sanitize_filename(query)
+            safe_query = sanitize_filename(query) or ScraperConfig.OUTPUT_FALLBACK_NAME
             timestamp = datetime.now().strftime(ScraperConfig.DATE_FORMAT)
             output_file = f"{ScraperConfig.OUTPUT_DIR}/{safe_query}_{timestamp}.csv"
+            # Resume log tanpa timestamp → run ulang query yang sama melanjutkan.
+            # Hash query asli: query berbeda dengan safe_query sama tidak
+            # saling skip atau menghapus log satu sama lain
+            query_hash = hashlib.sha1(query.encode('utf-8')).hexdigest()
+            resume_file = (
+                f"{ScraperConfig.OUTPUT_DIR}/{safe_query}_"
+                f"{query_hash[:ScraperConfig.RESUME_HASH_LENGTH]}"
+                f"{ScraperConfig.RESUME_FILE_SUFFIX}"
+            )
             
             # Scrape all
-            success_count, stats = self.scrape_all(links, output_file)
+            success_count, stats = self.scrape_all(
+                links, output_file, resume_file=resume_file
+            )
             
             return output_file, success_count, stats
             
@@ -725,20 +1507,101 @@ class GoogleMapsScraper:
             return "", 0, stats
             
         finally:
-            self.cleanup()
+            if keep_browser:
+                self.cleanup()
+            else:
+                self.close()
     
     def cleanup(self) -> None:
         """
-        Cleanup resources: close browser, tabs, etc.
+        Cleanup per run: tutup tab tambahan, browser tetap hidup.
         Akan dipanggil di finally block untuk ensure cleanup.
         """
         if self.driver:
+            if self.email_finder:
+                self.email_finder.close_email_tab()
             try:
                 close_extra_tabs(self.driver)
+            except Exception as e:
+                logger.warning(f"Warning saat cleanup: {e}")
+    
+    def close(self) -> None:
+        """
+        Tutup semua resources: tabs, browser, dan thread pool EmailFinder.
+        Setelah close(), setup_driver() akan membuat browser baru.
+        """
+        if self.email_finder:
+            self.email_finder.close()
+            self.email_finder = None
+        
+        if self.driver:
+            self.cleanup()
+            try:
                 self.driver.quit()
                 logger.info(f"✨ {const.SUCCESS_CLEANUP}")
             except Exception as e:
                 logger.warning(f"Warning saat cleanup: {e}")
+            finally:
+                self.driver = None
+                self.wait = None
+
+
+# ===========================================================================
+# Worker Process Handlers
+# ===========================================================================
+
+# Scraper milik worker process ini (dibuat oleh _init_worker)
+_worker_scraper: Optional[GoogleMapsScraper] = None
+
+
+def _init_worker(headless: bool) -> None:
+    """
+    Initializer worker process: setup WebDriver sekali per process.
+    
+    Args:
+        headless: Jika True, run browser dalam headless mode
+    """
+    global _worker_scraper
+    
+    # Ctrl+C ditangani main process, worker selesai lewat executor.shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    if _log_listener_pid is not None:
+        _start_log_listener()
+    
+    _worker_scraper = GoogleMapsScraper(headless=headless)
+    _worker_scraper.setup_driver()
+    
+    # atexit tidak jalan di worker; Finalize dipanggil saat worker exit normal
+    # (exitpriority lebih tinggi jalan lebih dulu: log close() masih ter-flush)
+    multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+    multiprocessing.util.Finalize(None, _stop_log_listener, exitpriority=1)
+
+
+def _worker_scrape(urls: List[str]) -> List[Dict[str, str]]:
+    """
+    Task worker: scrape satu chunk detail pages dengan browser milik worker.
+    
+    Args:
+        urls: List URL halaman detail bisnis
+    
+    Returns:
+        List data per URL, urutan sama dengan urls
+    
+    Raises:
+        WebDriverSetupError: Jika browser worker mati dan gagal di-setup ulang
+    
+    Note:
+        Browser yang mati (Chrome crash) di-setup ulang sebelum chunk di-scrape.
+        Error lain di-raise ke main process yang men-scrape ulang chunk-nya,
+        bukan diganti row kosong untuk sisa run.
+    """
+    if not _worker_scraper.is_driver_alive():
+        logger.warning("⚠️  Browser worker tidak merespons, setup ulang...")
+        _worker_scraper.close()
+        _worker_scraper.setup_driver()
+    
+    return _worker_scraper.scrape_detail_pages(urls)
 
 
 # ===========================================================================
@@ -746,23 +1609,25 @@ class GoogleMapsScraper:
 # ===========================================================================
 
 
-def get_search_query_input() -> str:
+def get_search_query_input() -> List[str]:
     """
-    Prompt user untuk memasukkan search query.
+    Prompt user untuk memasukkan satu atau beberapa search query.
+    Beberapa query dipisah dengan ';' dan dijalankan dengan browser yang sama.
 
     Returns:
-        Search query string, atau empty string jika tidak valid
+        List search query, atau empty list jika tidak valid
     """
-    query = input(
-        "📍 Masukkan kata kunci pencarian "
-        "(contoh: 'travel agent di Jakarta'): "
-    ).strip()
+    raw = input(
+        "📍 Masukkan kata kunci pencarian, pisahkan dengan ';' untuk beberapa query "
+        "(contoh: 'travel agent di Jakarta; travel agent di Bandung'): "
+    )
+    queries = [query.strip() for query in raw.split(';') if query.strip()]
 
-    if not query:
+    if not queries:
         print(f"❌ {const.ERROR_EMPTY_QUERY}")
-        return ""
+        return []
 
-    return query
+    return queries
 
 
 def get_max_scrolls_input() -> int:
@@ -793,6 +1658,34 @@ def get_max_scrolls_input() -> int:
             print(f"❌ {const.ERROR_INVALID_INPUT}")
 
 
+def get_worker_count_input() -> int:
+    """
+    Prompt user untuk memasukkan jumlah worker browser (detail pages paralel).
+
+    Returns:
+        Jumlah worker process (integer, minimal 1)
+    """
+    while True:
+        try:
+            user_input = input(
+                f"🧵 Jumlah browser worker "
+                f"(default: {ScraperConfig.WORKER_COUNT}, Enter = default): "
+            ).strip()
+
+            if not user_input:
+                return ScraperConfig.WORKER_COUNT
+
+            workers = int(user_input)
+            if workers < 1:
+                print(f"⚠️  {const.ERROR_INVALID_WORKERS}")
+                continue
+
+            return workers
+
+        except ValueError:
+            print(f"❌ {const.ERROR_INVALID_INPUT}")
+
+
 def get_validation_mode_input() -> str:
     """
     Prompt user untuk memilih validation mode.
@@ -886,8 +1779,8 @@ def main():
     print()
 
     # Collect user inputs
-    search_query = get_search_query_input()
-    if not search_query:
+    search_queries = get_search_query_input()
+    if not search_queries:
         return
 
     max_scrolls = get_max_scrolls_input()
@@ -897,6 +1790,7 @@ def main():
     print(f"✅ Mode dipilih: {validation_mode}")
 
     headless = get_headless_mode_input()
+    workers = get_worker_count_input()
 
     # Run scraper
     print()
@@ -904,11 +1798,21 @@ def main():
     print("=" * 70)
     print()
 
-    scraper = GoogleMapsScraper(headless=headless)
-    output_file, success_count, stats = scraper.run(search_query, max_scrolls)
+    # Satu browser untuk semua query (setup Chrome hanya sekali)
+    scraper = GoogleMapsScraper(headless=headless, workers=workers)
+    try:
+        for search_query in search_queries:
+            if shutdown_requested:
+                break
+
+            output_file, success_count, stats = scraper.run(
+                search_query, max_scrolls, keep_browser=True
+            )
 
-    # Print final report
-    print_final_report(output_file, success_count, stats)
+            # Print final report
+            print_final_report(output_file, success_count, stats)
+    finally:
+        scraper.close()
 
 
 if __name__ == "__main__":
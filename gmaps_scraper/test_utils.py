@@ -15,36 +15,61 @@ Author: rotiawan
 Date: 2025-11-22
 """
 
+import sys
+import time
+import logging
 import pytest
+import lxml.html
 from typing import Dict
+from selenium.common.exceptions import NoSuchWindowException
 
 # Import functions to test
 try:
     from .utils import (
         validate_email,
         extract_email_from_text,
+        extract_obfuscated_email,
         extract_city_from_address,
+        fetch_detail_fields,
         sanitize_filename,
+        load_done_links,
+        append_done_links,
         format_phone_number,
         validate_data,
+        make_validator,
         truncate_fields,
+        retry_on_failure,
+        wait_for_selector,
+        scroll_element,
+        ProgressTracker,
         DataStatistics
     )
     from . import constants as const
     from .config import ScraperConfig
+    from .gmaps_scraper import EmailFinder, GoogleMapsScraper
 except ImportError:
     from utils import (
         validate_email,
         extract_email_from_text,
+        extract_obfuscated_email,
         extract_city_from_address,
+        fetch_detail_fields,
         sanitize_filename,
+        load_done_links,
+        append_done_links,
         format_phone_number,
         validate_data,
+        make_validator,
         truncate_fields,
+        retry_on_failure,
+        wait_for_selector,
+        scroll_element,
+        ProgressTracker,
         DataStatistics
     )
     import constants as const
     from config import ScraperConfig
+    from gmaps_scraper import EmailFinder, GoogleMapsScraper
 
 
 class TestEmailValidation:
@@ -80,6 +105,18 @@ class TestEmailValidation:
         for email in invalid_emails:
             assert validate_email(email) is False, f"Email should be invalid: {email}"
     
+    def test_blacklist_matches_domain_not_substring(self):
+        """Test blacklist cocok per domain/subdomain, bukan substring"""
+        assert validate_email("info@notexample.com") is True
+        assert validate_email("info@example.com.au") is True
+        assert validate_email("info@mail.example.com") is False
+        assert validate_email("Info@EXAMPLE.COM") is False
+    
+    def test_image_extension_case_insensitive(self):
+        """Test image extension ditolak tanpa peduli huruf besar/kecil"""
+        assert validate_email("logo@brand.PNG") is False
+        assert validate_email("icon@2x.Webp") is False
+    
     def test_email_extraction_from_text(self):
         """Test extraction email dari text"""
         # Test dengan valid email
@@ -94,6 +131,44 @@ class TestEmailValidation:
         # Test tanpa email
         text3 = "No email address here"
         assert extract_email_from_text(text3) is None
+    
+    def test_email_extraction_skips_rejected_candidates(self):
+        """Test blacklist/image candidate dilewati dalam satu regex pass"""
+        text = "logo@brand.png info@mail.example.com sales@toko.co.id"
+        assert extract_email_from_text(text) == "sales@toko.co.id"
+        
+        # TLD tidak boleh dipotong agar lolos filter image extension
+        assert extract_email_from_text("icon@sprite.jpeg") is None
+        
+        # Mixed case: tetap ditemukan dan dikembalikan lowercase
+        assert extract_email_from_text("Mail: Sales@Toko.CO.ID") == "sales@toko.co.id"
+        assert extract_email_from_text("Logo@Brand.PNG info@EXAMPLE.com") is None
+    
+    def test_email_extraction_adversarial_input(self):
+        """Test input panjang tanpa email valid tetap selesai cepat (no ReDoS)"""
+        text = ("a" * 64 + "@" + "a-" * 200 + " ") * 500
+        start = time.perf_counter()
+        assert extract_email_from_text(text) is None
+        assert time.perf_counter() - start < 2.0
+    
+    def test_obfuscated_email_extraction(self):
+        """Test email bentuk "[at] / (dot)" dinormalisasi, kalimat biasa tidak match"""
+        assert (
+            extract_obfuscated_email("Kontak: Budi.S [at] tokobaru (dot) co [dot] id")
+            == "budi.s@tokobaru.co.id"
+        )
+        assert extract_obfuscated_email("sales (at) company.com") == "sales@company.com"
+        
+        assert extract_obfuscated_email("meet us at company dot com") is None
+        assert extract_obfuscated_email("info [at] example [dot] com") is None  # Blacklist
+    
+    def test_repeated_validation_is_cached(self):
+        """Test email yang sama divalidasi sekali, berikutnya dari cache"""
+        validate_email.cache_clear()
+        
+        assert validate_email("sales@tokobaru.co.id") is True
+        assert validate_email("sales@tokobaru.co.id") is True
+        assert validate_email.cache_info().hits == 1
 
 
 class TestAddressHandling:
@@ -118,6 +193,12 @@ class TestAddressHandling:
         
         # Address without comma
         assert extract_city_from_address("Main Street 123") == ""
+    
+    def test_extract_city_skips_postcode_segment(self):
+        """Test segmen terakhir yang hanya kode pos di-skip"""
+        address = "Jl. Braga No.10, Sumur Bandung, Bandung, Jawa Barat, 40111"
+        assert extract_city_from_address(address) == "Bandung"
+        assert extract_city_from_address("Bandung, 40111") == "Bandung"
 
 
 class TestPhoneFormatting:
@@ -168,6 +249,47 @@ class TestFilenameHandling:
         assert not result.endswith('_')
 
 
+class TestResumeLog:
+    """Test cases untuk resume log (load_done_links / append_done_links)"""
+    
+    def test_missing_file_is_empty(self, tmp_path):
+        """Test resume log yang belum ada → tidak ada link yang di-skip"""
+        assert load_done_links(str(tmp_path / "query.done")) == set()
+    
+    def test_append_and_load_roundtrip(self, tmp_path):
+        """Test link yang di-append terbaca lagi, termasuk dari beberapa append"""
+        path = str(tmp_path / "query.done")
+        append_done_links(path, ["https://maps.google.com/a", "https://maps.google.com/b"])
+        append_done_links(path, [])
+        append_done_links(path, ["https://maps.google.com/c"])
+        
+        assert load_done_links(path) == {
+            "https://maps.google.com/a",
+            "https://maps.google.com/b",
+            "https://maps.google.com/c",
+        }
+
+
+class TestEnvOverrides:
+    """Test cases untuk override integer via environment variable"""
+    
+    def test_valid_value_used(self, monkeypatch):
+        """Test nilai integer valid dipakai apa adanya"""
+        monkeypatch.setenv("GMAPS_TEST_INT", "4")
+        assert const._env_int("GMAPS_TEST_INT", 1) == 4
+    
+    def test_invalid_value_falls_back(self, monkeypatch, capsys):
+        """Test nilai non-numeric atau di bawah minimum → warning dan default"""
+        monkeypatch.delenv("GMAPS_TEST_INT", raising=False)
+        assert const._env_int("GMAPS_TEST_INT", 30) == 30
+        
+        for raw in ("abc", "0", "-5"):
+            monkeypatch.setenv("GMAPS_TEST_INT", raw)
+            assert const._env_int("GMAPS_TEST_INT", 30) == 30
+        
+        assert capsys.readouterr().out.count("Warning: GMAPS_TEST_INT") == 3
+
+
 class TestDataValidation:
     """Test cases untuk data validation"""
     
@@ -232,6 +354,16 @@ class TestDataValidation:
         )
         assert is_valid is False
     
+    def test_validation_reason_order(self):
+        """Test missing fields di reason urut sesuai CSV headers"""
+        data = {
+            const.CSV_HEADER_NAMA: "   ",  # Whitespace-only dianggap kosong
+            const.CSV_HEADER_WEBSITE: "https://test.com"
+        }
+        is_valid, reason = validate_data(data, const.VALIDATION_MODE_MODERATE)
+        assert is_valid is False
+        assert reason == f"Missing: {const.CSV_HEADER_NAMA}, {const.CSV_HEADER_EMAIL}"
+    
     def test_validation_lenient_mode(self):
         """Test validation dengan LENIENT mode"""
         is_valid, reason = validate_data(
@@ -249,6 +381,29 @@ class TestDataValidation:
         )
         # NONE mode should always pass
         assert is_valid is True
+    
+    def test_validate_data_reuses_validator(self, monkeypatch, caplog):
+        """Test validator di-cache per mode dan dibuat ulang jika rules berubah"""
+        data = {const.CSV_HEADER_NAMA: "PT ABC", const.CSV_HEADER_TELEPON: ""}
+        
+        with caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                validate_data(data, "CACHED_UNKNOWN_MODE")
+        assert sum("Invalid validation mode" in r.message for r in caplog.records) == 1
+        
+        monkeypatch.setitem(
+            ScraperConfig.VALIDATION_RULES,
+            const.VALIDATION_MODE_LENIENT,
+            frozenset([const.CSV_HEADER_TELEPON])
+        )
+        assert validate_data(data, const.VALIDATION_MODE_LENIENT) == (False, f"Missing: {const.CSV_HEADER_TELEPON}")
+    
+    def test_make_validator_matches_validate_data(self):
+        """Test validator dari make_validator() memberi hasil sama dengan validate_data()"""
+        validator = make_validator(const.VALIDATION_MODE_LENIENT)
+        
+        for data in (self.valid_data_lenient, {const.CSV_HEADER_NAMA: "PT Test"}, {}):
+            assert validator(data) == validate_data(data, const.VALIDATION_MODE_LENIENT)
 
 
 class TestTruncateFields:
@@ -284,6 +439,34 @@ class TestTruncateFields:
         # Should remain same
         assert truncated[const.CSV_HEADER_NAMA] == data[const.CSV_HEADER_NAMA]
         assert truncated[const.CSV_HEADER_TELEPON] == data[const.CSV_HEADER_TELEPON]
+    
+    def test_truncate_copies_only_when_needed(self):
+        """Test record bersih tidak di-copy, record panjang tidak mengubah input"""
+        clean = {const.CSV_HEADER_NAMA: "PT Test Company"}
+        assert truncate_fields(clean) is clean
+        
+        long_data = {const.CSV_HEADER_NAMA: "A" * 300}
+        truncated = truncate_fields(long_data)
+        assert truncated is not long_data
+        assert long_data[const.CSV_HEADER_NAMA] == "A" * 300
+
+
+class TestProgressTracker:
+    """Test cases untuk ProgressTracker log batching"""
+    
+    def test_logs_every_n_and_last_item(self, caplog):
+        """Test dengan log_every=3: log di item ke-3, ke-6, dan item terakhir"""
+        tracker = ProgressTracker(7, "Test", log_every=3)
+        
+        with caplog.at_level(logging.INFO):
+            for index in range(7):
+                tracker.update(1, f"item {index}")
+        
+        assert [record.getMessage() for record in caplog.records] == [
+            "Test [3/7] (42.9%) - item 2",
+            "Test [6/7] (85.7%) - item 5",
+            "Test [7/7] (100.0%) - item 6",
+        ]
 
 
 class TestDataStatistics:
@@ -340,6 +523,420 @@ class TestDataStatistics:
         assert "Missing email" in summary
 
 
+class TestCompiledSelectors:
+    """Test cases untuk precompiled lxml selectors"""
+    
+    def test_xpath_selector_compiled(self):
+        """Test XPath selector bisa dijalankan langsung ke lxml tree"""
+        tree = lxml.html.fromstring("<html><body><h1>PT Test</h1></body></html>")
+        compiled = ScraperConfig.get_compiled(const.SELECTOR_ID_NAME)
+        
+        result = compiled(tree)
+        assert len(result) == 1
+        assert result[0].text_content() == "PT Test"
+    
+    def test_css_selector_compiled(self):
+        """Test CSS selector di-translate ke XPath"""
+        tree = lxml.html.fromstring(
+            "<div role='feed'>"
+            "<a class='hfpxzc' href='/maps/place/a'></a>"
+            "<a class='other' href='/maps/place/b'></a>"
+            "</div>"
+        )
+        compiled = ScraperConfig.get_compiled(const.SELECTOR_ID_RESULT_LINKS)
+        
+        hrefs = [a.get('href') for a in compiled(tree)]
+        assert hrefs == ['/maps/place/a']
+    
+    def test_css_selector_resolved_to_xpath(self):
+        """Test CSS selector disimpan juga dalam bentuk XPath"""
+        xpath = ScraperConfig.get_xpath(const.SELECTOR_ID_RESULT_LINKS)
+        assert xpath.startswith("descendant-or-self::div")
+        
+        # XPath selector dikembalikan apa adanya
+        assert (
+            ScraperConfig.get_xpath(const.SELECTOR_ID_NAME)
+            == ScraperConfig.SELECTORS[const.SELECTOR_ID_NAME]
+        )
+    
+    def test_locator_strategy_per_selector(self):
+        """Test locator Selenium: XPath via By.XPATH, CSS via By.CSS_SELECTOR, tuple apa adanya"""
+        name = ScraperConfig.SELECTORS[const.SELECTOR_ID_NAME]
+        links = ScraperConfig.SELECTORS[const.SELECTOR_ID_RESULT_LINKS]
+        
+        assert ScraperConfig.get_locator(const.SELECTOR_ID_NAME) == ("xpath", name)
+        assert ScraperConfig.get_locator(const.SELECTOR_ID_RESULT_LINKS) == ("css selector", links)
+        assert (
+            ScraperConfig.get_locator(const.SELECTOR_ID_SEARCH_BOX)
+            == ScraperConfig.SELECTORS[const.SELECTOR_ID_SEARCH_BOX]
+        )
+    
+    def test_tuple_selector_not_compiled(self):
+        """Test selector (By, value) tuple tidak punya compiled version"""
+        with pytest.raises(KeyError):
+            ScraperConfig.get_compiled(const.SELECTOR_ID_SEARCH_BOX)
+
+
+class TestFetchDetailFields:
+    """Test cases untuk extract field detail page di browser"""
+    
+    def test_fetch_from_browser(self):
+        """Test field dari execute_script di-strip, field kosong/null jadi empty string"""
+        class FakeDriver:
+            def execute_script(self, script, queries):
+                self.queries = queries
+                return {const.CSV_HEADER_NAMA: "  PT Test \n", const.CSV_HEADER_LOGO: None}
+        
+        driver = FakeDriver()
+        fields = fetch_detail_fields(driver)
+        
+        assert fields[const.CSV_HEADER_NAMA] == "PT Test"
+        assert fields[const.CSV_HEADER_LOGO] == ""
+        assert set(fields) == set(ScraperConfig.DETAIL_FIELDS)
+        assert [query[0] for query in driver.queries] == list(ScraperConfig.DETAIL_FIELDS)
+
+
+class TestRetryOnFailure:
+    """Test cases untuk retry decorator (backoff + jitter)"""
+    
+    def test_retries_with_bounded_backoff(self, monkeypatch):
+        """Test retry sampai sukses, sleep naik eksponensial dan tidak lewat max_delay"""
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        calls = []
+        
+        @retry_on_failure(max_retries=4, delay=1, max_delay=3, jitter=0.5)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 4:
+                raise RuntimeError("transient")
+            return "ok"
+        
+        assert flaky() == "ok"
+        assert len(calls) == 4
+        assert 1 <= sleeps[0] <= 1.5
+        assert 2 <= sleeps[1] <= 3
+        assert sleeps[2] == 3
+    
+    def test_non_retryable_fails_fast(self, monkeypatch):
+        """Test exception di luar retry_on (atau di no_retry_on) tidak di-retry"""
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        calls = []
+        
+        @retry_on_failure(
+            max_retries=3,
+            retry_on=(TimeoutError, OSError),
+            no_retry_on=(FileNotFoundError,)
+        )
+        def fail(error):
+            calls.append(1)
+            raise error
+        
+        with pytest.raises(ValueError):
+            fail(ValueError("bug"))
+        with pytest.raises(FileNotFoundError):
+            fail(FileNotFoundError("missing"))
+        
+        assert len(calls) == 2
+    
+    def test_retry_on_wrapped_cause(self, monkeypatch):
+        """Test exception yang di-wrap (raise ... from e) di-retry berdasarkan cause"""
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        calls = []
+        
+        @retry_on_failure(max_retries=3, retry_on=(TimeoutError,))
+        def wrapped():
+            calls.append(1)
+            try:
+                raise TimeoutError("slow")
+            except TimeoutError as e:
+                raise RuntimeError("wrapped") from e
+        
+        with pytest.raises(RuntimeError):
+            wrapped()
+        
+        assert len(calls) == 3
+
+
+class TestWaitForSelector:
+    """Test cases untuk explicit wait pengganti time.sleep"""
+    
+    class FakeDriver:
+        def __init__(self, ready_after):
+            self.ready_after = ready_after
+            self.calls = []
+        
+        def execute_script(self, script, xpath):
+            self.calls.append(xpath)
+            return len(self.calls) >= self.ready_after
+    
+    def test_returns_when_selector_present(self):
+        """Test return True tanpa menunggu timeout penuh, multiple selector di-union"""
+        driver = self.FakeDriver(ready_after=2)
+        start = time.perf_counter()
+        
+        assert wait_for_selector(
+            driver, const.SELECTOR_ID_NAME, const.SELECTOR_ID_FEED, timeout=5
+        )
+        assert time.perf_counter() - start < 2
+        assert driver.calls[0] == (
+            ScraperConfig.get_xpath(const.SELECTOR_ID_NAME)
+            + " | "
+            + ScraperConfig.get_xpath(const.SELECTOR_ID_FEED)
+        )
+    
+    def test_timeout_returns_false(self):
+        """Test selector yang tidak pernah muncul return False, bukan raise"""
+        driver = self.FakeDriver(ready_after=10**6)
+        assert not wait_for_selector(driver, const.SELECTOR_ID_NAME, timeout=0.3)
+
+
+class TestScrollElement:
+    """Test cases untuk scroll + end-of-list check dalam satu round-trip"""
+    
+    class FakeDriver:
+        def __init__(self, end_after):
+            self.end_after = end_after
+            self.scripts = []
+        
+        def execute_script(self, script, *args):
+            self.scripts.append(script)
+            return len(self.scripts) > self.end_after
+    
+    def test_stops_at_end_marker(self, monkeypatch):
+        """Test satu execute_script per scroll, berhenti saat marker muncul"""
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        driver = self.FakeDriver(end_after=2)
+        
+        assert scroll_element(driver, object(), max_scrolls=10)
+        assert driver.scripts == [const.JS_SCROLL_UNTIL_END] * 3
+    
+    def test_max_scrolls_without_marker(self, monkeypatch):
+        """Test tanpa marker: max_scrolls scroll + satu cek akhir, return False"""
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        driver = self.FakeDriver(end_after=10**6)
+        
+        assert not scroll_element(driver, object(), max_scrolls=3)
+        assert driver.scripts == [const.JS_SCROLL_UNTIL_END] * 3 + [const.JS_XPATH_EXISTS]
+
+
+class TestEmailFinder:
+    """Test cases untuk cache email lookup dan HTTP scan per segmen"""
+    
+    class FakeDriver:
+        class timeouts:
+            page_load = 30
+    
+    class FakeResponse:
+        encoding = "utf-8"
+        
+        def __init__(self, chunks):
+            self.chunks = chunks
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc_info):
+            return False
+        
+        def iter_content(self, chunk_size, decode_unicode):
+            return iter(self.chunks)
+    
+    @pytest.fixture
+    def finder(self):
+        finder = EmailFinder(self.FakeDriver())
+        yield finder
+        finder.close()
+    
+    def test_shared_host_paths_are_cached_separately(self, finder, monkeypatch):
+        """Test halaman berbeda di host bersama tidak berbagi email"""
+        emails = {
+            "https://linktr.ee/bisnisA": "a@bisnis-a.com",
+            "https://linktr.ee/bisnisB": "b@bisnis-b.com",
+        }
+        scanned = []
+        
+        def fake_scan(url):
+            scanned.append(url)
+            return emails.get(url, ""), True
+        
+        monkeypatch.setattr(finder, "_scan_with_requests", fake_scan)
+        
+        for url, email in emails.items():
+            assert finder.resolve_lookup(url, finder.submit_lookup(url)) == email
+        assert scanned == list(emails)
+    
+    def test_same_website_variants_share_cache(self, finder, monkeypatch):
+        """Test www./trailing slash/scheme berbeda tetap satu entry cache"""
+        scanned = []
+        
+        def fake_scan(url):
+            scanned.append(url)
+            return "info@toko.com", True
+        
+        monkeypatch.setattr(finder, "_scan_with_requests", fake_scan)
+        
+        for url in ("https://toko.com/", "http://www.Toko.com", "https://toko.com"):
+            assert finder.resolve_lookup(url, finder.submit_lookup(url)) == "info@toko.com"
+        assert scanned == ["https://toko.com/"]
+    
+    def test_streamed_scan_prefers_mailto_in_later_segment(self, finder, monkeypatch):
+        """Test regex di segmen awal tidak mengalahkan mailto di segmen akhir"""
+        chunks = [
+            '<script>var s = "support@themevendor.io";</script><div>',
+            '<footer><a href="mailto:owner@bisnis.co.id">Email</a></footer>',
+        ]
+        monkeypatch.setattr(finder, "_open_with_requests", lambda url: self.FakeResponse(chunks))
+        
+        assert finder._scan_with_requests("https://bisnis.co.id") == ("owner@bisnis.co.id", True)
+        assert EmailFinder._find_in_html("".join(chunks), "HTTP") == "owner@bisnis.co.id"
+    
+    def test_streamed_scan_falls_back_to_first_regex_match(self, finder, monkeypatch):
+        """Test tanpa mailto: match regex pertama dipakai setelah stream selesai"""
+        chunks = [
+            '<p>Kontak: halo@bisnis.co.id</p><div>',
+            '<p>Partner: sales@partner.com</p>',
+        ]
+        monkeypatch.setattr(finder, "_open_with_requests", lambda url: self.FakeResponse(chunks))
+        
+        assert finder._scan_with_requests("https://bisnis.co.id") == ("halo@bisnis.co.id", True)
+    
+    def test_tagless_chunks_do_not_split_address(self, finder, monkeypatch):
+        """Test body tanpa tag: alamat yang terbelah chunk tidak ter-scan terpotong"""
+        chunks = ["contact us at owner@bisnisku.co", "m now for details"]
+        
+        segments = list(EmailFinder._iter_html_segments(self.FakeResponse(chunks)))
+        assert "".join(segments) == "".join(chunks)
+        
+        monkeypatch.setattr(finder, "_open_with_requests", lambda url: self.FakeResponse(chunks))
+        assert finder._scan_with_requests("https://bisnisku.com") == ("owner@bisnisku.com", True)
+
+
+def _failing_worker_init(headless):
+    """Initializer worker palsu: simulasi Chrome gagal start di worker"""
+    raise RuntimeError("Chrome failed to start")
+
+
+def _noop_worker_init(headless):
+    """Initializer worker palsu: tanpa browser"""
+
+
+def _fake_worker_scrape(urls):
+    """Task worker palsu: row terisi nama tanpa browser"""
+    return [dict(GoogleMapsScraper._empty_row(url), **{const.CSV_HEADER_NAMA: "PT Test"}) for url in urls]
+
+
+class TestScrapeDetailPages:
+    """Test cases untuk cleanup tab di scrape_detail_pages"""
+    
+    class FakeDriver:
+        """Driver palsu: tab baru crash (hilang) sebelum sempat di-switch"""
+        
+        def __init__(self):
+            self.current_window_handle = "main"
+            self.window_handles = ["main"]
+            self.crashed = set()
+            self.closed = []
+            self.switch_to = self
+        
+        def execute_script(self, script, *args):
+            handle = f"tab-{len(self.window_handles)}"
+            self.window_handles.append(handle)
+            self.crashed.add(handle)
+        
+        def window(self, handle):
+            if handle in self.crashed:
+                self.window_handles.remove(handle)
+                self.crashed.discard(handle)
+            if handle not in self.window_handles:
+                raise NoSuchWindowException(handle)
+            self.current_window_handle = handle
+        
+        def close(self):
+            self.closed.append(self.current_window_handle)
+            self.window_handles.remove(self.current_window_handle)
+    
+    def test_broken_worker_pool_falls_back_in_process(self, monkeypatch):
+        """Test worker gagal init (BrokenProcessPool) → chunk di-scrape di process utama"""
+        module = sys.modules[GoogleMapsScraper.__module__]
+        monkeypatch.setattr(module, "_init_worker", _failing_worker_init)
+        monkeypatch.setattr(ScraperConfig, "DETAIL_CONCURRENCY", 1)
+        
+        scraper = GoogleMapsScraper(workers=2)
+        scraped = []
+        
+        def fake_scrape(urls):
+            scraped.extend(urls)
+            return [GoogleMapsScraper._empty_row(url) for url in urls]
+        
+        monkeypatch.setattr(scraper, "scrape_detail_pages", fake_scrape)
+        links = [f"https://www.google.com/maps/place/{i}" for i in range(5)]
+        
+        rows = [row for batch in scraper._iter_detail_batches(links) for row in batch]
+        
+        assert scraped == links
+        assert [row[const.CSV_HEADER_MAP_URL] for row in rows] == links
+    
+    def test_shutdown_keeps_finished_worker_chunks(self, monkeypatch):
+        """Test saat shutdown, chunk in-flight yang sudah selesai tetap di-yield"""
+        module = sys.modules[GoogleMapsScraper.__module__]
+        monkeypatch.setattr(module, "_init_worker", _noop_worker_init)
+        monkeypatch.setattr(module, "_worker_scrape", _fake_worker_scrape)
+        monkeypatch.setattr(ScraperConfig, "DETAIL_CONCURRENCY", 1)
+        
+        scraper = GoogleMapsScraper(workers=2)
+        links = [f"https://www.google.com/maps/place/{i}" for i in range(6)]
+        batches = scraper._iter_detail_batches(links)
+        
+        first = next(batches)
+        # Tunggu 4 chunk in-flight selesai di worker, lalu minta shutdown
+        time.sleep(0.5)
+        monkeypatch.setattr(module, "shutdown_requested", True)
+        rest = [row for batch in batches for row in batch]
+        
+        urls = [row[const.CSV_HEADER_MAP_URL] for row in first + rest]
+        assert urls == links[:5]
+        assert all(row[const.CSV_HEADER_NAMA] for row in rest)
+    
+    def test_worker_restarts_dead_browser(self, monkeypatch):
+        """Test worker dengan browser mati setup ulang browser sebelum scrape"""
+        calls = []
+        
+        class FakeScraper:
+            def is_driver_alive(self):
+                return False
+            
+            def close(self):
+                calls.append("close")
+            
+            def setup_driver(self):
+                calls.append("setup")
+            
+            def scrape_detail_pages(self, urls):
+                calls.append("scrape")
+                return _fake_worker_scrape(urls)
+        
+        module = sys.modules[GoogleMapsScraper.__module__]
+        monkeypatch.setattr(module, "_worker_scraper", FakeScraper())
+        
+        rows = module._worker_scrape(["https://www.google.com/maps/place/a"])
+        
+        assert calls == ["close", "setup", "scrape"]
+        assert rows[0][const.CSV_HEADER_NAMA] == "PT Test"
+    
+    def test_crashed_tab_does_not_close_main_window(self):
+        """Test switch ke tab yang crash tidak membuat main window ikut di-close"""
+        scraper = GoogleMapsScraper(workers=1)
+        scraper.driver = driver = self.FakeDriver()
+        url = "https://www.google.com/maps/place/toko"
+        
+        rows = scraper.scrape_detail_pages([url])
+        
+        assert driver.closed == []
+        assert driver.current_window_handle == "main"
+        assert rows == [GoogleMapsScraper._empty_row(url)]
+
+
 # ============================================================================
 # Integration Tests (dapat dijalankan jika diperlukan)
 # ============================================================================
@@ -10,17 +10,18 @@ Date: 2025-11-22
 Version: 18.0.0
 """
 
-import re
 import logging
+import random
 import time
-from typing import Optional, Tuple, Dict
-from functools import wraps
+from collections import Counter
+from typing import Optional, Tuple, Dict, Type, List, Set, Callable
+from functools import lru_cache, wraps
+from operator import itemgetter
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
-    NoSuchElementException,
     TimeoutException,
     WebDriverException
 )
@@ -28,10 +29,10 @@ from selenium.common.exceptions import (
 # Import local modules
 try:
     from . import constants as const
-    from .config import ScraperConfig
+    from .config import ScraperConfig, DETAIL_FIELD_QUERIES
 except ImportError:
     import constants as const
-    from config import ScraperConfig
+    from config import ScraperConfig, DETAIL_FIELD_QUERIES
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -43,23 +44,34 @@ logger = logging.getLogger(__name__)
 
 def retry_on_failure(
     max_retries: int = ScraperConfig.MAX_RETRIES,
-    delay: int = ScraperConfig.RETRY_DELAY
+    delay: float = ScraperConfig.RETRY_DELAY,
+    max_delay: float = ScraperConfig.RETRY_MAX_DELAY,
+    jitter: float = ScraperConfig.RETRY_JITTER,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    no_retry_on: Tuple[Type[BaseException], ...] = ()
 ):
     """
-    Decorator untuk retry mechanism dengan exponential backoff.
+    Decorator untuk retry mechanism dengan exponential backoff + jitter.
     
-    Implementasi exponential backoff: delay * (backoff_factor ^ attempt)
-    Example: delay=2, backoff=2 → 2s, 4s, 8s, 16s, ...
+    Implementasi: min(max_delay, delay * (backoff_factor ^ attempt) * (1 + U(0, jitter)))
+    Example: delay=2, backoff=2 → ~2-3s, ~4-6s, ~8-12s, ...
+    Jitter mencegah banyak worker retry serempak ke server yang sama.
     
     Args:
         max_retries: Maksimal percobaan ulang
         delay: Delay awal dalam detik
+        max_delay: Batas atas delay antar percobaan
+        jitter: Fraksi random tambahan pada delay (0 = tanpa jitter)
+        retry_on: Exception yang boleh di-retry (dicek juga pada __cause__,
+            untuk exception yang di-wrap via ``raise ... from e``)
+        no_retry_on: Exception yang langsung di-raise tanpa retry, walaupun
+            termasuk retry_on (contoh NoSuchElementException)
     
     Returns:
         Decorated function yang akan di-retry jika gagal
     
     Example:
-        @retry_on_failure(max_retries=3, delay=2)
+        @retry_on_failure(max_retries=3, delay=2, retry_on=(TimeoutException,))
         def fetch_data():
             # ... code that might fail
             pass
@@ -67,7 +79,22 @@ def retry_on_failure(
     Note:
         Function akan raise exception terakhir jika semua retry gagal.
     """
+    def is_retryable(error: BaseException) -> bool:
+        for exc in (error, error.__cause__):
+            if exc is None or isinstance(exc, no_retry_on):
+                return False
+            if isinstance(exc, retry_on):
+                return True
+        return False
+    
     def decorator(func):
+        # Jadwal backoff (tanpa jitter) dihitung sekali saat decorate;
+        # tidak ada sleep setelah attempt terakhir
+        backoff_delays = tuple(
+            delay * (ScraperConfig.BACKOFF_FACTOR ** attempt)
+            for attempt in range(max_retries - 1)
+        )
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
@@ -79,12 +106,19 @@ def retry_on_failure(
                 except Exception as e:
                     last_exception = e
                     
+                    if not is_retryable(e):
+                        logger.error(f"Non-retryable error in {func.__name__}: {e}")
+                        raise
+                    
                     if attempt < max_retries - 1:
-                        # Calculate exponential backoff delay
-                        wait_time = delay * (ScraperConfig.BACKOFF_FACTOR ** attempt)
+                        # Exponential backoff delay + jitter
+                        wait_time = min(
+                            max_delay,
+                            backoff_delays[attempt] * (1 + random.random() * jitter)
+                        )
                         logger.warning(
                             f"Attempt {attempt + 1}/{max_retries} failed for "
-                            f"{func.__name__}: {e}. Retrying in {wait_time}s..."
+                            f"{func.__name__}: {e}. Retrying in {wait_time:.1f}s..."
                         )
                         time.sleep(wait_time)
                     else:
@@ -103,53 +137,6 @@ def retry_on_failure(
 # SELENIUM HELPER FUNCTIONS
 # ============================================================================
 
-def safe_find_element(
-    driver: WebDriver,
-    by: By,
-    selector: str,
-    attribute: Optional[str] = None,
-    default: str = ""
-) -> str:
-    """
-    Safely find element dan ambil text/attribute-nya.
-    Return default value jika element tidak ditemukan.
-    
-    Args:
-        driver: Selenium WebDriver instance
-        by: By locator strategy (By.XPATH, By.CSS_SELECTOR, etc)
-        selector: Selector string
-        attribute: Attribute name to get (None = get text content)
-        default: Default value if element not found
-    
-    Returns:
-        String value dari element atau default value
-    
-    Example:
-        # Get text content
-        name = safe_find_element(driver, By.XPATH, "//h1")
-        
-        # Get attribute
-        url = safe_find_element(driver, By.XPATH, "//a", attribute="href")
-    """
-    try:
-        element = driver.find_element(by, selector)
-        
-        if attribute:
-            value = element.get_attribute(attribute)
-        else:
-            value = element.text
-        
-        return value.strip() if value else default
-        
-    except NoSuchElementException:
-        logger.debug(f"Element tidak ditemukan: {selector}")
-        return default
-        
-    except Exception as e:
-        logger.debug(f"Error saat find element {selector}: {e}")
-        return default
-
-
 def close_extra_tabs(driver: WebDriver, keep_first: bool = True) -> None:
     """
     Tutup semua tab extra, keep hanya tab pertama.
@@ -161,28 +148,81 @@ def close_extra_tabs(driver: WebDriver, keep_first: bool = True) -> None:
     
     Note:
         Function ini akan gracefully handle jika tab sudah tertutup.
+        window_handles dibaca sekali (setiap akses = satu round-trip ke browser).
     """
     try:
-        if len(driver.window_handles) <= 1:
+        handles = driver.window_handles
+        if len(handles) <= 1:
             return  # No extra tabs to close
         
-        current_handle = driver.window_handles[0] if keep_first else None
+        current_handle = handles[0] if keep_first else None
         
-        for handle in driver.window_handles:
-            if keep_first and handle == current_handle:
+        for handle in handles:
+            if handle == current_handle:
                 continue
             
             driver.switch_to.window(handle)
             driver.close()
         
-        # Switch back to main window
-        if keep_first and current_handle:
+        # Switch back to main window (setelah close tidak ada window aktif)
+        if current_handle:
             driver.switch_to.window(current_handle)
             
     except Exception as e:
         logger.warning(f"Error closing tabs: {e}")
 
 
+def block_urls(driver: WebDriver, patterns: Tuple[str, ...]) -> bool:
+    """
+    Block request resource tertentu di tab aktif via Chrome DevTools Protocol.
+    
+    Args:
+        driver: Selenium WebDriver instance (Chromium)
+        patterns: URL pattern wildcard, contoh ('*.png', '*.woff2')
+    
+    Returns:
+        True jika block aktif, False jika driver tidak support CDP
+    
+    Note:
+        Berlaku per tab (CDP target): tab baru harus di-block ulang dan
+        block otomatis hilang saat tab ditutup.
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except (AttributeError, WebDriverException) as e:
+        logger.debug("CDP URL blocking tidak tersedia: %s", e)
+        return False
+
+
+def wait_for_selector(driver: WebDriver, *selector_ids: str, timeout: float) -> bool:
+    """
+    Tunggu sampai salah satu selector muncul di DOM, maksimal timeout detik.
+    
+    Pengganti time.sleep() dengan durasi tetap: return begitu halaman siap.
+    Dicek via JS (document.evaluate) sehingga tidak ikut tertahan implicit
+    wait driver saat element belum ada.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        *selector_ids: Satu atau lebih const.SELECTOR_ID_* (XPath atau CSS)
+        timeout: Maksimal waktu tunggu dalam detik
+    
+    Returns:
+        True jika selector ditemukan, False jika timeout
+    """
+    xpath = " | ".join(ScraperConfig.get_xpath(selector_id) for selector_id in selector_ids)
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            lambda d: d.execute_script(const.JS_XPATH_EXISTS, xpath)
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
 def scroll_element(
     driver: WebDriver,
     element: WebElement,
@@ -203,38 +243,68 @@ def scroll_element(
     
     Note:
         Function akan stop early jika menemukan "end of list" marker.
+        Cek marker dan scroll digabung dalam satu execute_script per
+        iterasi (bukan find_elements + execute_script terpisah).
     """
+    end_xpath = ScraperConfig.get_xpath(const.SELECTOR_ID_END_OF_LIST)
+    
     for i in range(max_scrolls):
-        # Scroll to bottom
-        driver.execute_script(
-            "arguments[0].scrollTop = arguments[0].scrollHeight",
-            element
-        )
+        # Check end of list marker (hasil scroll sebelumnya), lalu scroll to bottom
+        if driver.execute_script(const.JS_SCROLL_UNTIL_END, element, end_xpath):
+            logger.info(f"✅ {const.INFO_REACH_END} setelah {i} scroll")
+            return True
         time.sleep(pause_time)
         
-        # Check end of list marker
-        try:
-            end_markers = driver.find_elements(
-                By.XPATH,
-                ScraperConfig.SELECTORS[const.SELECTOR_ID_END_OF_LIST]
-            )
-            if end_markers:
-                logger.info(f"✅ {const.INFO_REACH_END} setelah {i+1} scroll")
-                return True
-        except Exception:
-            pass  # Continue scrolling
-        
         # Log progress periodically
         if (i + 1) % ScraperConfig.SCROLL_PROGRESS_INTERVAL == 0:
             logger.info(f"Progress scroll: {i+1}/{max_scrolls}")
     
+    # Marker yang muncul setelah scroll terakhir
+    if driver.execute_script(const.JS_XPATH_EXISTS, end_xpath):
+        logger.info(f"✅ {const.INFO_REACH_END} setelah {max_scrolls} scroll")
+        return True
+    
     return False
 
 
+# ============================================================================
+# HTML PARSING FUNCTIONS
+# ============================================================================
+
+def fetch_detail_fields(driver: WebDriver) -> Dict[str, str]:
+    """
+    Extract semua field detail page langsung di browser, satu round-trip.
+    
+    XPath per field (DETAIL_FIELD_QUERIES) dievaluasi via
+    document.evaluate, jadi yang dikirim balik hanya nilai field (beberapa
+    ratus byte), bukan seluruh page_source.
+    
+    Args:
+        driver: Selenium WebDriver dengan halaman detail sudah ter-load
+    
+    Returns:
+        Dictionary CSV header -> raw value (text atau attribute).
+        Field yang tidak ditemukan berisi empty string.
+    
+    Raises:
+        WebDriverException: Jika script gagal dijalankan di browser
+    """
+    raw = driver.execute_script(
+        const.JS_EXTRACT_DETAIL_FIELDS,
+        [list(query) for query in DETAIL_FIELD_QUERIES]
+    ) or {}
+    
+    return {
+        header: (raw.get(header) or "").strip()
+        for header in ScraperConfig.DETAIL_FIELDS
+    }
+
+
 # ============================================================================
 # DATA VALIDATION FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=const.EMAIL_VALIDATION_CACHE_SIZE)
 def validate_email(email: str) -> bool:
     """
     Validasi email address dengan regex dan business rules.
@@ -256,27 +326,30 @@ def validate_email(email: str) -> bool:
         False  # example.com is blacklisted
         >>> validate_email("user@company.co.id")
         True
-    """
-    if not email or len(email) < ScraperConfig.EMAIL_MIN_LENGTH:
-        return False
     
-    if len(email) > ScraperConfig.EMAIL_MAX_LENGTH:
+    Note:
+        Pure function dari email string → hasil di-cache (lru_cache), email
+        yang berulang di banyak halaman hanya divalidasi sekali.
+    """
+    if not email or not (
+        ScraperConfig.EMAIL_MIN_LENGTH <= len(email) <= ScraperConfig.EMAIL_MAX_LENGTH
+    ):
         return False
     
     # Regex validation
-    if not re.match(const.EMAIL_PATTERN, email):
+    if not const.EMAIL_RE.match(email):
         return False
     
-    # Blacklist check
-    email_lower = email.lower()
-    for blacklisted in ScraperConfig.EMAIL_BLACKLIST:
-        if blacklisted in email_lower:
-            return False
+    # Blacklist check: set lookup per label suffix (example.com, mail.example.com),
+    # bukan substring, jadi notexample.com tidak ikut ter-block
+    labels = email.rsplit('@', 1)[-1].lower().split('.')
+    blacklist = ScraperConfig.EMAIL_BLACKLIST
+    if any('.'.join(labels[i:]) in blacklist for i in range(len(labels) - 1)):
+        return False
     
     # Image extension check
-    for ext in ScraperConfig.EMAIL_IMAGE_EXTENSIONS:
-        if ext in email_lower:
-            return False
+    if const.EMAIL_IMAGE_EXT_RE.search(email):
+        return False
     
     return True
 
@@ -299,11 +372,40 @@ def extract_email_from_text(text: str) -> Optional[str]:
     if not text:
         return None
     
-    matches = re.findall(const.EMAIL_EXTRACT_PATTERN, text.lower())
+    # Blacklist & image extension sudah ditolak oleh regex; validate_email
+    # tinggal jadi guard terakhir (length limits) untuk candidate yang lolos.
+    # Regex case-insensitive → tidak perlu copy text.lower(), cukup lowercase match
+    for match in const.EMAIL_COMBINED_RE.finditer(text):
+        email = match.group(0).lower()
+        if validate_email(email):
+            return email
     
-    for match in matches:
-        if validate_email(match):
-            return match
+    return None
+
+
+def extract_obfuscated_email(text: str) -> Optional[str]:
+    """
+    Extract email yang ditulis dalam bentuk obfuscated, contoh
+    "info [at] company [dot] com". Return first valid email found.
+    
+    Args:
+        text: Text source (HTML, plain text, etc)
+    
+    Returns:
+        Email address (sudah dinormalisasi) jika ditemukan dan valid, None jika tidak
+    
+    Example:
+        >>> extract_obfuscated_email("Email: info (at) company (dot) co (dot) id")
+        "info@company.co.id"
+    """
+    if not text:
+        return None
+    
+    for match in const.EMAIL_OBFUSCATED_RE.finditer(text):
+        domain = const.EMAIL_OBFUSCATED_DOT_RE.sub('.', match.group(2))
+        email = f"{match.group(1)}@{domain}".lower()
+        if validate_email(email):
+            return email
     
     return None
 
@@ -328,6 +430,58 @@ def validate_data(
         >>> data = {"namaTravel": "PT ABC", "telepon": "021123"}
         >>> is_valid, reason = validate_data(data, "LENIENT")
         >>> print(is_valid)  # True
+    
+    Note:
+        Validator per mode di-cache (lihat _cached_validator), jadi mode
+        dicek dan required fields di-resolve sekali, bukan setiap record.
+    """
+    rules = ScraperConfig.VALIDATION_RULES
+    # Mode invalid fallback ke MODERATE di make_validator → rules-nya ikut key
+    required_fields = rules.get(mode, rules[const.VALIDATION_MODE_MODERATE])
+    return _cached_validator(mode, required_fields)(data)
+
+
+@lru_cache(maxsize=32)
+def _cached_validator(
+    mode: str,
+    required_fields: frozenset
+) -> Callable[[Dict[str, str]], Tuple[bool, str]]:
+    """
+    make_validator() yang di-cache per (mode, required fields).
+    
+    required_fields hanya dipakai sebagai bagian key: jika VALIDATION_RULES
+    diubah saat runtime, validator baru dibuat. Warning mode invalid juga
+    hanya di-log sekali per mode.
+    
+    Args:
+        mode: Validation mode (boleh invalid, fallback di make_validator)
+        required_fields: Rules yang berlaku untuk mode ini
+    
+    Returns:
+        Validator dari make_validator(mode)
+    """
+    return make_validator(mode)
+
+
+def make_validator(
+    mode: str = ScraperConfig.VALIDATION_MODE
+) -> Callable[[Dict[str, str]], Tuple[bool, str]]:
+    """
+    Buat validator untuk satu validation mode.
+    
+    Mode dicek dan required fields di-resolve sekali di sini, sehingga
+    per record hanya tersisa pengecekan field yang wajib.
+    
+    Args:
+        mode: Validation mode ('STRICT', 'MODERATE', 'LENIENT', 'NONE')
+    
+    Returns:
+        Callable(data) -> (is_valid, reason), hasil sama dengan validate_data()
+    
+    Example:
+        >>> validator = make_validator("LENIENT")
+        >>> validator({"namaTravel": "PT ABC", "telepon": "021123"})
+        (True, "Valid")
     """
     # Validate mode
     if mode not in const.VALIDATION_MODES:
@@ -338,20 +492,38 @@ def validate_data(
     
     # Mode NONE: semua data valid
     if not required_fields:
-        return True, "No validation required"
+        return lambda data: (True, "No validation required")
     
-    # Check required fields
-    missing_fields = []
-    for field in required_fields:
-        value = data.get(field, "").strip()
-        if not value:
-            missing_fields.append(field)
+    # Urut sesuai CSV_HEADERS agar reason (dan skip statistics) deterministik
+    ordered_fields = tuple(
+        field for field in ScraperConfig.CSV_HEADERS if field in required_fields
+    ) + tuple(sorted(required_fields.difference(ScraperConfig.CSV_HEADERS)))
     
-    if missing_fields:
-        reason = f"Missing: {', '.join(missing_fields)}"
-        return False, reason
+    # Semua required value diambil dalam satu C call (row lengkap = kasus umum)
+    get_values = itemgetter(*ordered_fields)
+    single_field = len(ordered_fields) == 1
     
-    return True, "Valid"
+    def validator(data: Dict[str, str]) -> Tuple[bool, str]:
+        try:
+            values = get_values(data)
+            if single_field:
+                values = (values,)
+        except KeyError:
+            # Row parsial (key tidak ada = kosong)
+            values = tuple(data.get(field) for field in ordered_fields)
+        
+        # Whitespace-only = kosong
+        missing_fields = [
+            field for field, value in zip(ordered_fields, values)
+            if not value or not value.strip()
+        ]
+        
+        if missing_fields:
+            return False, f"Missing: {', '.join(missing_fields)}"
+        
+        return True, "Valid"
+    
+    return validator
 
 
 # ============================================================================
@@ -367,27 +539,29 @@ def truncate_fields(data: Dict[str, str]) -> Dict[str, str]:
         data: Dictionary data
     
     Returns:
-        New dictionary dengan fields yang sudah di-truncate
+        New dictionary dengan fields yang sudah di-truncate, atau data
+        itu sendiri (tanpa copy) jika tidak ada field yang terlalu panjang
     
     Note:
         Truncated fields akan diberi suffix "..." untuk indikasi.
     """
-    truncated = {}
+    truncated = None
+    # Satu class attribute lookup per row, bukan dua per field
+    max_lengths = ScraperConfig.MAX_FIELD_LENGTH
     
     for key, value in data.items():
-        if key in ScraperConfig.MAX_FIELD_LENGTH:
-            max_len = ScraperConfig.MAX_FIELD_LENGTH[key]
+        max_len = max_lengths.get(key)
+        
+        if max_len is not None and value and len(value) > max_len:
+            # Copy baru dibuat saat field pertama yang perlu di-truncate
+            if truncated is None:
+                truncated = dict(data)
             
-            if value and len(value) > max_len:
-                # Truncate dan tambah ellipsis
-                truncated[key] = value[:max_len - 3] + "..."
-                logger.debug(f"Truncated {key}: {len(value)} → {max_len} chars")
-            else:
-                truncated[key] = value
-        else:
-            truncated[key] = value
+            # Truncate dan tambah ellipsis
+            truncated[key] = value[:max_len - 3] + "..."
+            logger.debug("Truncated %s: %d → %d chars", key, len(value), max_len)
     
-    return truncated
+    return data if truncated is None else truncated
 
 
 def extract_city_from_address(address: str) -> str:
@@ -395,9 +569,9 @@ def extract_city_from_address(address: str) -> str:
     Extract nama kota dari string alamat (best effort).
     
     Heuristic:
-    - Split by comma
+    - Split by comma (dari kanan, maksimal 4 bagian)
     - Ambil bagian kedua dari belakang
-    - Skip jika hanya angka (kemungkinan kode pos)
+    - Skip bagian terakhir jika hanya angka (kemungkinan kode pos)
     
     Args:
         address: String alamat lengkap
@@ -412,24 +586,17 @@ def extract_city_from_address(address: str) -> str:
     if not address:
         return ""
     
-    try:
-        parts = [p.strip() for p in address.split(',')]
-        
-        if len(parts) > 1:
-            # Ambil bagian kedua dari belakang
-            city_candidate = parts[-2]
-            
-            # Cek apakah bagian terakhir adalah kode pos (pure digits)
-            last_part = parts[-1].split()[-1]
-            if re.match(r'^\d+$', last_part) and len(parts) > 2:
-                city_candidate = parts[-3]
-            
-            return city_candidate
-            
-    except Exception as e:
-        logger.debug(f"Error extracting city from '{address}': {e}")
+    # rsplit: kepala alamat yang tidak dipakai tidak ikut di-split
+    parts = address.rsplit(',', 3)
     
-    return ""
+    if len(parts) < 2:
+        return ""
+    
+    # isdecimal() = semantics yang sama dengan regex \d+
+    if len(parts) > 2 and parts[-1].strip().isdecimal():
+        return parts[-3].strip()
+    
+    return parts[-2].strip()
 
 
 def format_phone_number(phone: str) -> str:
@@ -453,8 +620,12 @@ def format_phone_number(phone: str) -> str:
     # Remove common prefixes
     phone = phone.strip()
     
+    # Sudah bersih (kasus umum): tidak perlu sub + strip ulang
+    if not const.PHONE_CLEANUP_RE.search(phone):
+        return phone
+    
     # Clean: keep only digits, +, spaces, (), -
-    phone = re.sub(const.PHONE_CLEANUP_PATTERN, '', phone)
+    phone = const.PHONE_CLEANUP_RE.sub('', phone)
     
     return phone.strip()
 
@@ -464,7 +635,7 @@ def sanitize_filename(text: str, max_length: int = const.MAX_LENGTH_FILENAME) ->
     Sanitize text untuk dijadikan filename yang aman.
     
     Rules:
-    - Keep only alphanumeric, spaces, hyphens, underscores
+    - Keep only ASCII alphanumeric, spaces, hyphens, underscores
     - Replace spaces/multiple underscores with single underscore
     - Lowercase
     - Limit length
@@ -480,14 +651,11 @@ def sanitize_filename(text: str, max_length: int = const.MAX_LENGTH_FILENAME) ->
         >>> sanitize_filename("Travel Umrah di Jakarta!!", 30)
         "travel_umrah_di_jakarta"
     """
-    # Replace special chars with underscore
-    sanitized = "".join(
-        c if c.isalnum() or c in (' ', '-', '_') else '_'
-        for c in text
-    )
+    # Replace special chars with underscore (satu regex pass, bukan loop per char)
+    sanitized = const.FILENAME_STRIP_RE.sub('_', text)
     
     # Replace multiple spaces/underscores with single underscore
-    sanitized = re.sub(const.FILENAME_ALLOWED_CHARS_PATTERN, '_', sanitized)
+    sanitized = const.FILENAME_ALLOWED_CHARS_RE.sub('_', sanitized)
     
     # Trim, lowercase
     sanitized = sanitized.strip('_').lower()
@@ -499,6 +667,51 @@ def sanitize_filename(text: str, max_length: int = const.MAX_LENGTH_FILENAME) ->
     return sanitized
 
 
+# ============================================================================
+# RESUME LOG FUNCTIONS
+# ============================================================================
+
+def load_done_links(path: str) -> Set[str]:
+    """
+    Baca resume log: URL detail page yang sudah selesai di run sebelumnya.
+    
+    Args:
+        path: Path resume log (satu URL per baris)
+    
+    Returns:
+        Set URL, kosong jika file belum ada atau tidak bisa dibaca
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            return {line for line in f.read().splitlines() if line}
+    except FileNotFoundError:
+        return set()
+    except OSError as e:
+        logger.warning("Resume log %s tidak bisa dibaca: %s", path, e)
+        return set()
+
+
+def append_done_links(path: str, links: List[str]) -> None:
+    """
+    Tambahkan URL yang sudah selesai ke resume log.
+    
+    Hanya dipanggil setelah row-nya ter-flush ke CSV, sehingga resume log
+    tidak pernah mencatat URL yang datanya belum ada di disk.
+    
+    Args:
+        path: Path resume log
+        links: URL yang sudah selesai
+    """
+    if not links:
+        return
+    
+    try:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(links) + '\n')
+    except OSError as e:
+        logger.warning("Resume log %s tidak bisa ditulis: %s", path, e)
+
+
 # ============================================================================
 # PROGRESS TRACKING CLASSES
 # ============================================================================
@@ -511,6 +724,7 @@ class ProgressTracker:
         total: Total items yang akan diproses
         current: Current progress counter
         desc: Description/label untuk progress
+        log_every: Log setiap N item (item terakhir selalu di-log)
     
     Example:
         tracker = ProgressTracker(100, "Processing")
@@ -520,17 +734,24 @@ class ProgressTracker:
         tracker.complete()
     """
     
-    def __init__(self, total: int, desc: str = "Progress"):
+    def __init__(
+        self,
+        total: int,
+        desc: str = "Progress",
+        log_every: int = ScraperConfig.PROGRESS_LOG_INTERVAL
+    ):
         """
         Initialize progress tracker.
         
         Args:
             total: Total items yang akan diproses
             desc: Description label
+            log_every: Log setiap N item (1 = setiap update)
         """
         self.total = total
         self.current = 0
         self.desc = desc
+        self.log_every = max(1, log_every)
     
     def update(self, increment: int = 1, message: str = "") -> None:
         """
@@ -539,8 +760,21 @@ class ProgressTracker:
         Args:
             increment: Jumlah increment (default: 1)
             message: Optional message untuk di-log
+        
+        Note:
+            Jika log_every > 1, hanya update yang melewati kelipatan
+            log_every (atau mencapai total) yang di-log; sisanya hanya
+            menaikkan counter tanpa formatting.
         """
+        previous = self.current
         self.current += increment
+        
+        if (
+            self.current // self.log_every == previous // self.log_every
+            and self.current != self.total
+        ):
+            return
+        
         percentage = (self.current / self.total * 100) if self.total > 0 else 0
         status = f"[{self.current}/{self.total}] ({percentage:.1f}%)"
         
@@ -568,7 +802,7 @@ class DataStatistics:
         total_processed: Total data yang diproses
         total_saved: Total data yang berhasil disimpan
         total_skipped: Total data yang di-skip
-        skip_reasons: Dictionary of skip reasons dan count-nya
+        skip_reasons: Counter of skip reasons (reason -> count)
     
     Example:
         stats = DataStatistics()
@@ -580,12 +814,15 @@ class DataStatistics:
         print(stats.get_summary())
     """
     
+    # Atribut tetap → tanpa __dict__ per instance
+    __slots__ = ('total_processed', 'total_saved', 'total_skipped', 'skip_reasons')
+    
     def __init__(self):
         """Initialize statistics counters"""
         self.total_processed = 0
         self.total_saved = 0
         self.total_skipped = 0
-        self.skip_reasons: Dict[str, int] = {}
+        self.skip_reasons: Counter = Counter()
     
     def add_saved(self) -> None:
         """Increment saved counter"""
@@ -603,7 +840,7 @@ class DataStatistics:
         self.total_skipped += 1
         
         # Track skip reasons
-        self.skip_reasons[reason] = self.skip_reasons.get(reason, 0) + 1
+        self.skip_reasons[reason] += 1
     
     def get_success_rate(self) -> float:
         """
@@ -643,13 +880,7 @@ class DataStatistics:
             lines.append("║  📋 Alasan Dilewati:                                     ║")
             
             # Sort by count (descending)
-            sorted_reasons = sorted(
-                self.skip_reasons.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            
-            for reason, count in sorted_reasons:
+            for reason, count in self.skip_reasons.most_common():
                 # Truncate reason if too long
                 reason_short = reason[:40] if len(reason) > 40 else reason
                 lines.append(f"║     • {reason_short:<40} : {count:>3}  ║")
@@ -51,7 +51,7 @@ setup(
     
     # === PACKAGE CONFIGURATION ===
     packages=find_packages(exclude=["tests", "tests.*"]),
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     install_requires=requirements,
     
     # === CLASSIFIERS ===
@@ -73,9 +73,6 @@ setup(
         
         # Python Versions
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         